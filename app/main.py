@@ -1152,12 +1152,14 @@ def FeedsSidebar(session_id, for_mobile=False):
                     Input(
                         placeholder="Enter RSS URL", 
                         name="new_feed_url",  # This maps to FastHTML function parameter
-                        cls="flex-1 mr-2 add-feed-input"
+                        cls="flex-1 mr-2 add-feed-input",
+                        data_testid="add-feed-input"
                     ),
                     Button(
                         UkIcon('plus'),
                         cls="px-2 add-feed-button",
-                        type="submit"
+                        type="submit",
+                        data_testid="add-feed-btn"
                     )
                 ),
                 hx_post="/api/feed/add",
@@ -27,17 +27,29 @@ def pytest_configure(config):
     )
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """Let PLAYWRIGHT_WORKERS cap ``-n auto`` (one browser + server per worker)"""
+    workers = os.environ.get('PLAYWRIGHT_WORKERS')
+    if workers:
+        return int(workers)
+    return None
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_xdist_server():
     """Setup server for pytest-xdist workers"""
     worker_id = os.environ.get('PYTEST_XDIST_WORKER', None)
     
     if worker_id:
-        # This is an xdist worker - start minimal server 
-        print(f"🔧 Worker {worker_id}: Starting minimal server...")
+        # This is an xdist worker - start minimal server on a port of its own.
+        # Workers must not pkill each other's servers (that includes the UI
+        # suite's per-worker test_server_url servers, also run as `python -m app`).
+        port = worker_port(worker_id)
+        print(f"🔧 Worker {worker_id}: Starting minimal server on port {port}...")
         os.environ['MINIMAL_MODE'] = 'true'
         
-        server_process = start_test_server(minimal=True)
+        server_process = start_test_server(minimal=True, port=port, kill_existing=False)
         if server_process:
             print(f"✅ Worker {worker_id}: Server started (PID: {server_process.pid})")
             yield server_process
@@ -78,17 +90,25 @@ def server_manager():
             stop_test_server(server_process)
 
 
-def start_test_server(minimal: bool = True, timeout: int = 20) -> Optional[subprocess.Popen]:
+def worker_port(worker_id: str, base: int = 8080) -> int:
+    """Deterministic per-worker server port: gw0 -> 8081, gw1 -> 8082, ..."""
+    return base + 1 + int(worker_id.lstrip('gw'))
+
+
+def start_test_server(minimal: bool = True, timeout: int = 20, port: int = 8080,
+                      kill_existing: bool = True) -> Optional[subprocess.Popen]:
     """Start the test server and wait for it to be ready"""
     env = os.environ.copy()
+    env['PORT'] = str(port)
     if minimal:
         env['MINIMAL_MODE'] = 'true'
     
     try:
-        # Kill any existing servers
-        subprocess.run(['pkill', '-f', 'python -m app'],
-                      capture_output=True, check=False)
-        time.sleep(1)
+        if kill_existing:
+            # Kill any existing servers
+            subprocess.run(['pkill', '-f', 'python -m app'],
+                          capture_output=True, check=False)
+            time.sleep(1)
         
         # Start new server
         server_process = subprocess.Popen([
@@ -98,7 +118,7 @@ def start_test_server(minimal: bool = True, timeout: int = 20) -> Optional[subpr
         # Wait for server to be ready
         for i in range(timeout):
             try:
-                response = httpx.get('http://localhost:8080', timeout=1)
+                response = httpx.get(f'http://localhost:{port}', timeout=1)
                 if response.status_code == 200:
                     return server_process
             except httpx.RequestError:
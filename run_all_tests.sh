@@ -29,6 +29,9 @@ fi
 
 # Use pytest-xdist for parallelization
 PYTEST_ARGS="-n auto --dist=loadfile"
+# UI tests carry xdist_group markers (see tests/ui/conftest.py): one group per
+# module, plus "ui_browser" pinning shared_context tests to a single worker
+UI_PYTEST_ARGS="-n auto --dist=loadgroup"
 
 echo ""
 
@@ -48,7 +51,7 @@ run_all_tests() {
     # Run UI tests (auto-start servers via conftest.py)
     echo ""
     echo "🌐 Running UI tests..."
-    python -m pytest tests/ui/ $PYTEST_ARGS -v
+    python -m pytest tests/ui/ $UI_PYTEST_ARGS -v
     UI_RESULT=$?
     
     # Run specialized tests (network/docker)
@@ -76,7 +79,7 @@ run_integration_tests() {
 
 run_ui_tests() {
     echo "🌐 Running UI tests..."
-    python -m pytest tests/ui/ $PYTEST_ARGS -v
+    python -m pytest tests/ui/ $UI_PYTEST_ARGS -v
 }
 
 run_specialized_tests() {
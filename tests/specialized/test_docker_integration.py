@@ -11,6 +11,11 @@ import time
 import subprocess
 import os
 import socket
+import sys
+
+# Share the UI suite's HTMX wait helpers instead of keeping a copy here
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'ui'))
+from test_helpers import wait_for_htmx_complete
 
 def get_free_port():
     """Find an available port on the system"""
@@ -20,10 +25,15 @@ def get_free_port():
         port = s.getsockname()[1]
     return port
 
-# HTMX Helper Functions for Fast Testing  
-def wait_for_htmx_complete(page, timeout=5000):
-    """Wait for all HTMX requests to complete - much faster than fixed timeouts"""
-    page.wait_for_function("() => !document.body.classList.contains('htmx-request')", timeout=timeout)
+def wait_for_htmx_idle(page, timeout=5000):
+    """Wait for the DOM and HTMX to be up with no request in flight
+    
+    Stands in for networkidle, which always sits out a further 500ms of network
+    silence after the page has loaded. HTMX puts htmx-request on the requesting
+    element, so the whole document is checked rather than just <body>.
+    """
+    page.wait_for_load_state("domcontentloaded")
+    page.wait_for_function("() => window.htmx && document.querySelector('.htmx-request') === null", timeout=timeout)
 
 @pytest.fixture(scope="module")
 def docker_container():
@@ -102,7 +112,7 @@ def test_docker_integration(docker_container):
         # Desktop functionality
         page.goto(docker_url)
         page.set_viewport_size({"width": 1920, "height": 1080})
-        page.wait_for_load_state("networkidle")
+        wait_for_htmx_idle(page)
         
         desktop_visible = page.locator("#desktop-layout").is_visible()
         articles_count = page.locator("#desktop-feeds-content .js-filter li").count()
@@ -121,7 +131,7 @@ def test_docker_integration(docker_container):
         # Mobile functionality
         page.set_viewport_size({"width": 375, "height": 812})
         page.goto(docker_url)
-        page.wait_for_load_state("networkidle")
+        wait_for_htmx_idle(page)
         
         mobile_visible = page.locator("#main-content").is_visible()
         mobile_articles = page.locator("#main-content .js-filter li").count()
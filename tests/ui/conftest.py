@@ -1,7 +1,8 @@
-"""Shared Playwright fixtures for UI tests with module-level isolation
+"""Shared Playwright fixtures for UI tests with per-test context isolation
 
-Each test MODULE (file) gets its own browser instance for isolation when running
-files in parallel, but tests within a module share the browser for efficiency.
+Each pytest-xdist worker launches one browser for the whole session; every test
+still gets its own browser context, so cookies and server sessions never leak
+between tests while Chromium startup is paid once per worker.
 
 Server Dependency Management:
 - UI tests require a running server (marked with @pytest.mark.needs_server)
@@ -12,7 +13,204 @@ Server Dependency Management:
 import pytest
 import httpx
 import os
+import sqlite3
+import sys
+from urllib.parse import urlparse
 from playwright.sync_api import sync_playwright
+import test_constants as constants
+from test_helpers import wait_for_chrome_ready, wait_for_page_ready
+
+# Chromium subsystems the HTMX UI suite never exercises (GPU, audio, sync,
+# translate, extensions...). Stripping them cuts launch time and per-browser
+# RAM, which lets more xdist workers run before the runner starts swapping.
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-translate",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+    "--disable-features=Translate,BackForwardCache,MediaRouter,OptimizationHints",
+    "--disable-renderer-backgrounding",
+]
+
+# The suite checks text, visibility, URLs and classes - never pixels - so images are
+# not even requested. Tests marked ``visual`` get a browser launched without this.
+NO_IMAGES_ARG = "--blink-settings=imagesEnabled=false"
+
+# Options for every context the suite opens. The app registers no service worker,
+# so blocking registration only skips activation work for the CDN scripts.
+CONTEXT_OPTIONS = {"service_workers": "block"}
+
+# Hosts the page genuinely needs: the test server plus the CDNs serving HTMX,
+# FrankenUI and Tailwind (layout visibility depends on Tailwind's lg: classes).
+# Everything else - feed images, analytics - is aborted.
+CDN_HOSTS = {"cdn.jsdelivr.net", "cdn.tailwindcss.com"}
+ALLOWED_HOSTS = {"localhost", "127.0.0.1"} | CDN_HOSTS
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+# CDN responses by URL, kept for the worker's lifetime. Contexts don't share
+# Chromium's HTTP cache, so without this every test re-downloads the same scripts
+# and stylesheets; hop-by-hop/encoding headers are dropped as the body is decoded.
+_cdn_cache = {}
+_UNCACHED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def continue_or_replay(route, url):
+    """Serve CDN GETs from the worker's cache (fetching on a miss); send anything else on to the network"""
+    request = route.request
+    if url.hostname not in CDN_HOSTS or request.method != "GET":
+        route.continue_()
+        return
+    cached = _cdn_cache.get(request.url)
+    if cached is None:
+        response = route.fetch()
+        cached = {
+            "status": response.status,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in _UNCACHED_HEADERS},
+            "body": response.body(),
+        }
+        if response.ok:
+            _cdn_cache[request.url] = cached
+    route.fulfill(**cached)
+
+
+def block_third_party_requests(route):
+    """Context route handler: abort heavy or off-site loads, pass the rest through
+    
+    Favicons are answered with an empty 200 instead: they never reach the test
+    server, and no "failed to load resource" error lands in the console.
+    """
+    request = route.request
+    url = urlparse(request.url)
+    if url.path.endswith("/favicon.ico"):
+        route.fulfill(status=200, body=b"")
+    elif request.resource_type in BLOCKED_RESOURCE_TYPES or url.hostname not in ALLOWED_HOSTS:
+        route.abort()
+    else:
+        continue_or_replay(route, url)
+
+
+def block_off_site_requests(route):
+    """Route handler for ``visual`` tests: images and fonts load, off-site hosts stay blocked"""
+    url = urlparse(route.request.url)
+    if url.hostname not in ALLOWED_HOSTS:
+        route.abort()
+    else:
+        continue_or_replay(route, url)
+
+# Counts in-flight fetch/XHR requests (HTMX uses XHR) so tests can wait for the page
+# to go quiet without networkidle's 500ms idle window; read by test_helpers.wait_for_quiet
+INFLIGHT_COUNTER_JS = """(() => {
+    let inflight = 0;
+    window.__inflight = () => inflight;
+    const fetch = window.fetch;
+    window.fetch = (...args) => { inflight++; return fetch(...args).finally(() => inflight--); };
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        inflight++;
+        this.addEventListener('loadend', () => inflight--);
+        return send.apply(this, args);
+    };
+})();"""
+
+
+def prepare_context(context, handler=block_third_party_requests):
+    """Install the request block list and the in-flight counter on a new context"""
+    context.route("**/*", handler)
+    context.add_init_script(INFLIGHT_COUNTER_JS)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Assign UI tests to xdist groups for ``--dist=loadgroup``
+    
+    Tests marked shared_context all land in the "ui_browser" group so a single
+    worker owns the session's persistent Chromium. Every other UI test is grouped
+    by module, which keeps the file-level isolation ``--dist=loadfile`` gave us.
+    Tests marked fully_parallel get a group of their own, so a module's methods
+    spread across workers (Playwright's ``fullyParallel``). Tests that already
+    carry an explicit xdist_group keep it.
+    """
+    ui_dir = os.path.dirname(__file__)
+    for item in items:
+        if not str(item.fspath).startswith(ui_dir + os.sep):
+            continue
+        if item.get_closest_marker("xdist_group"):
+            continue
+        if item.get_closest_marker("shared_context"):
+            group = "ui_browser"
+        elif item.get_closest_marker("fully_parallel"):
+            group = item.nodeid
+        else:
+            group = item.module.__name__
+        item.add_marker(pytest.mark.xdist_group(group))
+
+
+# Database behind each server this worker auto-started, by URL. A TEST_SERVER_URL
+# server is not listed: its database is out of reach.
+SERVER_DBS = {}
+
+
+def forget_feeds(db_path, urls):
+    """Delete feeds (and their subscriptions) a test added, so later sessions on the
+    worker's server aren't subscribed to them - ``before()`` subscribes new sessions
+    to every feed in the table"""
+    with sqlite3.connect(db_path) as conn:
+        for url in urls:
+            conn.execute("DELETE FROM user_feeds WHERE feed_id IN (SELECT id FROM feeds WHERE url = ?)", (url,))
+            conn.execute("DELETE FROM feeds WHERE url = ?", (url,))
+
+
+def forget_reads(db_path):
+    """Mark every item unread again, so a warm session starts each test the way the
+    first one found it. A worker runs one test at a time against its own server,
+    so no other session is mid-test."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM user_items")
+
+
+@pytest.fixture(scope="session")
+def server_db(test_server_url):
+    """Path to the worker's server database, for tests that check or undo what they stored"""
+    db_path = SERVER_DBS.get(test_server_url)
+    if db_path is None:
+        pytest.skip("Needs the auto-started test server's database (TEST_SERVER_URL is in use)")
+    return db_path
+
+
+class StoredFeeds:
+    """Feeds a test adds to the server, read back from its database"""
+    
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.urls = []
+    
+    def track(self, url):
+        """Delete this URL's feed at teardown - call before submitting it"""
+        self.urls.append(url)
+    
+    def get(self, url):
+        """The feeds row stored for a URL, or None"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM feeds WHERE url = ?", (url,)).fetchone()
+        return dict(row) if row else None
+
+
+@pytest.fixture(scope="function")
+def stored_feeds(server_db):
+    """A ``StoredFeeds`` whose tracked feeds are deleted again at teardown
+    
+    Add feed tests create real rows in the worker's shared server; left behind,
+    every later session on that worker would list them in its sidebar.
+    """
+    feeds = StoredFeeds(server_db)
+    yield feeds
+    forget_feeds(server_db, feeds.urls)
 
 
 @pytest.fixture(scope="session")
@@ -70,12 +268,18 @@ def test_server_url():
     env = os.environ.copy()
     env.update({
         'MINIMAL_MODE': 'true',
-        'PORT': str(port)
+        'PORT': str(port),
+        # No uvicorn reloader: the app runs in the process we start, so its
+        # database is data/minimal.<server_process.pid>.db (see SERVER_DBS)
+        'PRODUCTION': 'true',
     })
     
+    # Output goes to DEVNULL: nobody reads these pipes, and under -n auto the app's
+    # DEBUG logging would fill a PIPE buffer and stall the worker's server mid-test
     server_process = subprocess.Popen([
-        'python', '-m', 'app'
-    ], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=os.getcwd())
+        sys.executable, '-m', 'app'
+    ], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=os.getcwd())
+    SERVER_DBS[server_url] = os.path.join(os.getcwd(), 'data', f'minimal.{server_process.pid}.db')
     
     # Register cleanup function
     def cleanup_server():
@@ -121,22 +325,186 @@ def test_server_url():
     cleanup_server()
 
 
-@pytest.fixture(scope="module")  # One browser per test file/module
-def browser():
-    """Create a browser instance per test module for parallel suite execution"""
+@pytest.fixture(scope="session")
+def playwright():
+    """Single Playwright driver per session, shared by every browser fixture"""
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        yield browser
-        browser.close()
+        yield p
 
 
-@pytest.fixture(scope="function")  # Each test gets its own page/context
-def page(browser, test_server_url):
-    """Create a new page in a new context for test isolation within a module"""
-    context = browser.new_context()
+@pytest.fixture(scope="session")  # One browser per xdist worker
+def browser(playwright):
+    """Create a browser instance shared by every test this worker runs"""
+    browser = playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS + [NO_IMAGES_ARG], chromium_sandbox=False)
+    yield browser
+    browser.close()
+
+
+@pytest.fixture(scope="session")
+def visual_browser(playwright):
+    """Browser that renders images and fonts, launched only if a ``visual`` test runs"""
+    browser = playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS, chromium_sandbox=False)
+    yield browser
+    browser.close()
+
+
+@pytest.fixture(scope="session")
+def persistent_context(playwright, tmp_path_factory):
+    """One persistent Chromium context per session for tests marked shared_context"""
+    context = playwright.chromium.launch_persistent_context(
+        str(tmp_path_factory.mktemp("chromium-profile")),
+        headless=True,
+        args=CHROMIUM_ARGS,
+        chromium_sandbox=False,
+        **CONTEXT_OPTIONS,
+    )
+    prepare_context(context)
+    yield context
+    context.close()
+
+
+@pytest.fixture(scope="session")
+def warm_storage(browser, test_server_url):
+    """Storage state of a session that has already loaded the app once, kept per worker
+    
+    The first visit is when the server creates the session and subscribes its
+    default feeds; contexts started from this snapshot skip that cold load. The
+    state stays an in-memory dict, so no context re-reads a JSON file from disk.
+    """
+    context = browser.new_context(**CONTEXT_OPTIONS)
+    prepare_context(context)
     page = context.new_page()
-    yield page
+    page.goto(test_server_url, timeout=constants.MAX_WAIT_MS)
+    wait_for_page_ready(page)
+    state = context.storage_state()
     context.close()
+    return state
+
+
+@pytest.fixture(scope="session")
+def warm_context(browser, warm_storage):
+    """One context per worker resuming the warmed session, reused by warm_session tests
+    
+    Every warm test already shares the snapshot's session cookie, and with it
+    the server-side session, so handing them the same browser context costs no
+    isolation and saves a context setup per test.
+    """
+    context = browser.new_context(viewport=constants.DESKTOP_VIEWPORT, storage_state=warm_storage, **CONTEXT_OPTIONS)
+    prepare_context(context)
+    yield context
+    context.close()
+
+
+@pytest.fixture(scope="function")  # Each test gets its own context
+def context(request, browser):
+    """A fresh context on the session browser, opened at the desktop viewport
+    
+    Contexts cost tens of milliseconds against a second or so for a browser
+    launch, so isolation is per test while the browser is per worker. Tests
+    marked ``warm_session`` reuse the worker's ``warm_context`` instead of
+    starting a new session, unless they are also marked ``cold_start``; their
+    pages are closed, permissions reset and read state cleared afterwards. When
+    the server's database isn't known (an external ``TEST_SERVER_URL``) read
+    state can't be cleared, so those tests get a fresh session instead. Tests
+    marked ``visual`` run on a browser that loads images and fonts.
+    """
+    visual = request.node.get_closest_marker("visual")
+    warm = request.node.get_closest_marker("warm_session") and not request.node.get_closest_marker("cold_start")
+    db_path = SERVER_DBS.get(request.getfixturevalue("test_server_url")) if warm else None
+    if db_path and not visual:
+        context = request.getfixturevalue("warm_context")
+        yield context
+        for page in context.pages:
+            page.close()
+        context.clear_permissions()
+        forget_reads(db_path)
+        return
+    
+    options = dict(CONTEXT_OPTIONS)
+    if db_path:  # Visual tests resume the snapshot on their own browser
+        options["storage_state"] = request.getfixturevalue("warm_storage")
+    handler = block_third_party_requests
+    if visual:
+        browser = request.getfixturevalue("visual_browser")
+        handler = block_off_site_requests
+    context = browser.new_context(viewport=constants.DESKTOP_VIEWPORT, **options)
+    prepare_context(context, handler)
+    yield context
+    context.close()
+    if db_path:
+        forget_reads(db_path)
+
+
+@pytest.fixture(scope="function")  # Each test gets its own page/context
+def page(request, test_server_url):
+    """Create a new page in a new context for test isolation
+    
+    Tests marked ``shared_context`` skip the per-test context and open a page in
+    the session's persistent context instead; cookies are cleared afterwards so
+    every test still starts with a fresh server session.
+    """
+    if request.node.get_closest_marker("shared_context"):
+        context = request.getfixturevalue("persistent_context")
+        page = context.new_page()
+        yield page
+        page.close()
+        context.clear_cookies()
+        return
+    
+    yield request.getfixturevalue("context").new_page()
+
+
+@pytest.fixture(scope="function")
+def new_context(request, browser):
+    """Factory for extra contexts on the session browser, with the same block list as ``page``
+    
+    Tests that need several contexts or custom viewports/user agents call
+    ``new_context(viewport=...)``; the viewport defaults to the desktop one like
+    ``context``. Tests marked ``visual`` get their contexts on the browser that
+    loads images and fonts, as ``context`` does. Anything still open is closed
+    at teardown.
+    """
+    contexts = []
+    handler = block_third_party_requests
+    if request.node.get_closest_marker("visual"):
+        browser = request.getfixturevalue("visual_browser")
+        handler = block_off_site_requests
+    
+    def factory(**kwargs):
+        kwargs.setdefault("viewport", constants.DESKTOP_VIEWPORT)
+        context = browser.new_context(**CONTEXT_OPTIONS, **kwargs)
+        prepare_context(context, handler)
+        contexts.append(context)
+        return context
+    
+    yield factory
+    for context in contexts:
+        context.close()
+
+
+@pytest.fixture(scope="function")
+def loaded_page(page, test_server_url):
+    """The app loaded at the default (desktop) viewport with its chrome rendered
+    
+    A shared preamble for tests that start from the front page; tests that need
+    a specific viewport before the first render keep their own goto.
+    """
+    page.goto(test_server_url)
+    wait_for_chrome_ready(page)
+    return page
+
+
+@pytest.fixture(scope="function")
+def page_errors(page):
+    """Uncaught JavaScript errors raised on ``page``, asserted empty at teardown
+    
+    The listener is attached before the test navigates, so errors thrown
+    during page load and by every later interaction are captured.
+    """
+    errors = []
+    page.on("pageerror", lambda error: errors.append(str(error)))
+    yield errors
+    assert not errors, f"JavaScript errors detected: {errors}"
 
 
 @pytest.fixture(scope="function")
@@ -144,8 +512,10 @@ def mobile_context(browser, test_server_url):
     """Create a mobile browser context (iPhone 12 Pro dimensions)"""
     context = browser.new_context(
         viewport={'width': 390, 'height': 844},
-        user_agent='Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15'
+        user_agent='Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15',
+        **CONTEXT_OPTIONS,
     )
+    prepare_context(context)
     page = context.new_page()
     yield page
-    context.close()
\ No newline at end of file
+    context.close()
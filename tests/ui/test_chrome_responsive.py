@@ -2,8 +2,56 @@
 
 import pytest
 from playwright.sync_api import Page, expect
-
-
+from test_helpers import wait_for_chrome_ready, wait_for_htmx_complete
+
+# Tailwind's lg breakpoint: the desktop layout/chrome switch on at this width
+DESKTOP_MEDIA_QUERY = "(min-width: 1024px)"
+
+
+def wait_for_viewport(page, is_desktop):
+    """Wait until the lg media query reflects the new viewport instead of sleeping"""
+    page.wait_for_function(
+        "([query, desktop]) => matchMedia(query).matches === desktop",
+        arg=[DESKTOP_MEDIA_QUERY, is_desktop],
+    )
+
+
+def chrome_y_around_scroll(page, chrome_sel, scroller_sel, top=200):
+    """Scroll a container and return the chrome's viewport y before and after, in one evaluate
+
+    getBoundingClientRect forces a synchronous layout, so the post-scroll read
+    needs no wait.
+    """
+    return page.evaluate("""([chromeSel, scrollerSel, top]) => {
+        const chrome = document.querySelector(chromeSel);
+        const before = chrome.getBoundingClientRect().y;
+        document.querySelector(scrollerSel).scrollTop = top;
+        return [before, chrome.getBoundingClientRect().y];
+    }""", [chrome_sel, scroller_sel, top])
+
+
+def chrome_snapshot(page):
+    """Visibility, feed names and button counts of both chromes in one evaluate round trip"""
+    return page.evaluate("""() => {
+        const el = (sel) => document.querySelector(sel);
+        const visible = (sel) => { const e = el(sel); return !!e && e.checkVisibility(); };
+        return {
+            desktopChrome: visible('#desktop-chrome-container'),
+            desktopFeedName: visible('#desktop-chrome-container h3'),
+            desktopFeedText: el('#desktop-chrome-container h3')?.textContent ?? '',
+            desktopIconBar: visible('#desktop-icon-bar'),
+            desktopButtons: document.querySelectorAll('#desktop-icon-bar button').length,
+            mobileHeader: visible('#mobile-top-bar'),
+            mobileNavButton: visible('#mobile-nav-button'),
+            mobileFeedName: visible('#mobile-top-bar h3'),
+            mobileFeedText: el('#mobile-top-bar h3')?.textContent ?? '',
+            mobileIconBar: visible('#mobile-icon-bar'),
+            mobileButtons: document.querySelectorAll('#mobile-icon-bar button').length,
+        };
+    }""")
+
+
+@pytest.mark.shared_context
 class TestUnifiedChromeResponsive:
     """Test the unified chrome component across mobile and desktop viewports"""
 
@@ -13,148 +61,123 @@ class TestUnifiedChromeResponsive:
         # Start with desktop viewport
         page.set_viewport_size({"width": 1400, "height": 900})
         page.goto(test_server_url)
-        page.wait_for_load_state("networkidle")
+        wait_for_chrome_ready(page)
 
         # Desktop view assertions
-        desktop_chrome = page.locator("#desktop-chrome-container")
-        mobile_header = page.locator("#mobile-top-bar")
+        snap = chrome_snapshot(page)
 
         # Desktop chrome should be visible
-        expect(desktop_chrome).to_be_visible()
-        expect(mobile_header).to_be_hidden()
-
-        # Check desktop chrome has feed name and action buttons
-        desktop_feed_name = desktop_chrome.locator("h3")
-        expect(desktop_feed_name).to_be_visible()
-        expect(desktop_feed_name).to_contain_text("All Feeds")
-        expect(page.locator("#desktop-icon-bar")).to_be_visible()
-
-        # Verify desktop chrome has the three action buttons
-        desktop_buttons = page.locator("#desktop-icon-bar button")
-        expect(desktop_buttons).to_have_count(3)
-
-        # Test scrolling in desktop - chrome should stay fixed
-        feeds_content = page.locator("#desktop-feeds-content")
-        initial_chrome_position = desktop_chrome.bounding_box()["y"]
-
-        # Scroll the feeds content
-        feeds_content.evaluate("el => el.scrollTop = 200")
-        page.wait_for_timeout(100)  # Small wait for scroll
-
-        # Chrome should remain in same position (not scroll)
-        scrolled_chrome_position = desktop_chrome.bounding_box()["y"]
+        assert snap["desktopChrome"], "Desktop chrome should be visible"
+        assert not snap["mobileHeader"], "Mobile header should be hidden on desktop"
+
+        # Check desktop chrome has feed name and the three action buttons
+        assert snap["desktopFeedName"], "Desktop feed name should be visible"
+        assert "All Feeds" in snap["desktopFeedText"]
+        assert snap["desktopIconBar"], "Desktop icon bar should be visible"
+        assert snap["desktopButtons"] == 3, f"Expected 3 desktop action buttons, got {snap['desktopButtons']}"
+
+        # Test scrolling in desktop - chrome should stay fixed while the feeds content scrolls
+        initial_chrome_position, scrolled_chrome_position = chrome_y_around_scroll(
+            page, "#desktop-chrome-container", "#desktop-feeds-content")
         assert initial_chrome_position == scrolled_chrome_position, "Desktop chrome should not scroll"
 
         # Switch to mobile viewport
         page.set_viewport_size({"width": 375, "height": 667})
-        page.wait_for_timeout(500)  # Wait for responsive transition
+        wait_for_viewport(page, is_desktop=False)
+
+        snap = chrome_snapshot(page)
 
         # Mobile view assertions
-        expect(desktop_chrome).to_be_hidden()
-        expect(mobile_header).to_be_visible()
+        assert not snap["desktopChrome"], "Desktop chrome should be hidden on mobile"
+        assert snap["mobileHeader"], "Mobile header should be visible"
 
         # Check mobile header has hamburger button AND feed name
-        mobile_nav_button = page.locator("#mobile-nav-button")
-        expect(mobile_nav_button).to_be_visible()
-
-        # Verify hamburger icon is present
-        expect(mobile_nav_button.locator('[icon="menu"]')).to_be_visible()
-
-        # Check mobile ALSO has feed name displayed
-        mobile_feed_name = mobile_header.locator("h3")
-        expect(mobile_feed_name).to_be_visible()
-        expect(mobile_feed_name).to_contain_text("All Feeds")
+        assert snap["mobileNavButton"], "Hamburger button should be visible"
+        assert snap["mobileFeedName"], "Mobile feed name should be visible"
+        assert "All Feeds" in snap["mobileFeedText"]
 
         # Check mobile has the same action buttons
-        expect(page.locator("#mobile-icon-bar")).to_be_visible()
-        mobile_buttons = page.locator("#mobile-icon-bar button")
-        expect(mobile_buttons).to_have_count(3)
+        assert snap["mobileIconBar"], "Mobile icon bar should be visible"
+        assert snap["mobileButtons"] == 3, f"Expected 3 mobile action buttons, got {snap['mobileButtons']}"
 
-        # Test scrolling in mobile - header should stay fixed
-        main_content = page.locator("#main-content")
-        initial_header_position = mobile_header.bounding_box()["y"]
+        # The hamburger icon is drawn by FrankenUI after load, so keep the auto-waiting check
+        expect(page.locator("#mobile-nav-button").locator('[icon="menu"]')).to_be_visible()
 
-        # Scroll the main content
-        main_content.evaluate("el => el.scrollTop = 200")
-        page.wait_for_timeout(100)  # Small wait for scroll
-
-        # Mobile header should remain fixed at top
-        scrolled_header_position = mobile_header.bounding_box()["y"]
+        # Test scrolling in mobile - header should stay fixed at the top while main content scrolls
+        initial_header_position, scrolled_header_position = chrome_y_around_scroll(
+            page, "#mobile-top-bar", "#main-content")
         assert initial_header_position == scrolled_header_position, "Mobile header should stay fixed"
         assert scrolled_header_position == 0, "Mobile header should be at top of viewport"
 
-    def test_chrome_transitions_smoothly(self, page: Page, test_server_url: str):
-        """Test smooth transitions between mobile and desktop chrome"""
-
+    @pytest.mark.parametrize("width,height,expect_desktop", [
+        (1400, 900, True),
+        (800, 600, False),
+        (1200, 800, True),
+        (375, 667, False),
+    ], ids=["desktop-1400", "mobile-800", "desktop-1200", "mobile-375"])
+    def test_chrome_transitions_smoothly(self, page: Page, test_server_url: str, width, height, expect_desktop):
+        """Test the chrome switches variant when resizing across the breakpoint"""
+
+        # Load on the opposite side of the breakpoint so every case is a real transition
+        start = {"width": 375, "height": 667} if expect_desktop else {"width": 1400, "height": 900}
+        page.set_viewport_size(start)
         page.goto(test_server_url)
-        page.wait_for_load_state("networkidle")
-
-        # Test multiple viewport changes
-        viewports = [
-            {"width": 1400, "height": 900, "expect_desktop": True},
-            {"width": 800, "height": 600, "expect_desktop": False},
-            {"width": 1200, "height": 800, "expect_desktop": True},
-            {"width": 375, "height": 667, "expect_desktop": False},
-        ]
-
-        for viewport in viewports:
-            page.set_viewport_size({"width": viewport["width"], "height": viewport["height"]})
-            page.wait_for_timeout(300)  # Wait for transition
-
-            desktop_chrome = page.locator("#desktop-chrome-container")
-            mobile_header = page.locator("#mobile-top-bar")
-
-            if viewport["expect_desktop"]:
-                expect(desktop_chrome).to_be_visible()
-                expect(mobile_header).to_be_hidden()
-                # Verify desktop chrome content
-                expect(desktop_chrome.locator("h3")).to_be_visible()
-                expect(page.locator("#desktop-icon-bar")).to_be_visible()
-            else:
-                expect(desktop_chrome).to_be_hidden()
-                expect(mobile_header).to_be_visible()
-                # Verify mobile chrome content
-                expect(page.locator("#mobile-nav-button")).to_be_visible()
-                expect(page.locator("#mobile-icon-bar")).to_be_visible()
-
-    def test_chrome_action_buttons_consistent(self, page: Page, test_server_url: str):
+        wait_for_chrome_ready(page)
+
+        page.set_viewport_size({"width": width, "height": height})
+        wait_for_viewport(page, expect_desktop)
+
+        # One round trip for the whole post-resize state
+        snap = chrome_snapshot(page)
+
+        if expect_desktop:
+            assert snap["desktopChrome"] and not snap["mobileHeader"], f"Desktop chrome expected: {snap}"
+            # Verify desktop chrome content
+            assert snap["desktopFeedName"] and snap["desktopIconBar"], f"Desktop chrome content missing: {snap}"
+        else:
+            assert snap["mobileHeader"] and not snap["desktopChrome"], f"Mobile header expected: {snap}"
+            # Verify mobile chrome content
+            assert snap["mobileNavButton"] and snap["mobileIconBar"], f"Mobile chrome content missing: {snap}"
+
+    def test_chrome_action_buttons_consistent(self, loaded_page: Page, test_server_url: str):
         """Test that action buttons work consistently in both views"""
 
-        page.goto(test_server_url)
-        page.wait_for_load_state("networkidle")
+        page = loaded_page
+
+        desktop_bar = page.locator("#desktop-icon-bar")
+        mobile_bar = page.locator("#mobile-icon-bar")
 
         # Test in desktop view first
         page.set_viewport_size({"width": 1400, "height": 900})
 
         # Click "All Posts" in desktop
-        page.locator("#desktop-icon-bar button[title='All Posts']").click()
-        page.wait_for_load_state("networkidle")
+        desktop_bar.get_by_title("All Posts", exact=True).click()
+        wait_for_htmx_complete(page)
         expect(page).to_have_url(f"{test_server_url}/?unread=0")
 
         # Go back to unread
-        page.locator("#desktop-icon-bar button[title='Unread']").click()
-        page.wait_for_load_state("networkidle")
+        desktop_bar.get_by_title("Unread", exact=True).click()
+        wait_for_htmx_complete(page)
         expect(page).to_have_url(f"{test_server_url}/")
 
         # Switch to mobile and test same functionality
         page.set_viewport_size({"width": 375, "height": 667})
-        page.wait_for_timeout(300)
+        wait_for_viewport(page, is_desktop=False)
 
         # Click "All Posts" in mobile
-        page.locator("#mobile-icon-bar button[title='All Posts']").click()
-        page.wait_for_load_state("networkidle")
+        mobile_bar.get_by_title("All Posts", exact=True).click()
+        wait_for_htmx_complete(page)
         expect(page).to_have_url(f"{test_server_url}/?unread=0")
 
         # Go back to unread
-        page.locator("#mobile-icon-bar button[title='Unread']").click()
-        page.wait_for_load_state("networkidle")
+        mobile_bar.get_by_title("Unread", exact=True).click()
+        wait_for_htmx_complete(page)
         expect(page).to_have_url(f"{test_server_url}/")
 
-    def test_feed_name_changes_both_views(self, page: Page, test_server_url: str):
+    def test_feed_name_changes_both_views(self, loaded_page: Page, test_server_url: str):
         """Test that feed name updates correctly when switching feeds"""
 
-        page.goto(test_server_url)
-        page.wait_for_load_state("networkidle")
+        page = loaded_page
 
         # Desktop view - verify initial feed name
         page.set_viewport_size({"width": 1400, "height": 900})
@@ -162,18 +185,17 @@ class TestUnifiedChromeResponsive:
         expect(desktop_feed_name).to_contain_text("All Feeds")
 
         # Click on a specific feed in desktop sidebar (if available)
-        feed_link = page.locator("#sidebar a[href*='feed_id']").first
+        feed_link = page.locator("#sidebar").locator("a[href*='feed_id']").first
         if feed_link.count() > 0:
-            feed_text = feed_link.inner_text()
             feed_link.click()
-            page.wait_for_load_state("networkidle")
+            wait_for_htmx_complete(page)
 
             # Verify desktop chrome shows the selected feed name
             expect(desktop_feed_name).not_to_contain_text("All Feeds")
 
         # Mobile view - verify feed name is also shown
         page.set_viewport_size({"width": 375, "height": 667})
-        page.wait_for_timeout(300)
+        wait_for_viewport(page, is_desktop=False)
 
         mobile_feed_name = page.locator("#mobile-top-bar h3")
         expect(mobile_feed_name).to_be_visible()
@@ -184,22 +206,25 @@ class TestUnifiedChromeResponsive:
         else:
             expect(mobile_feed_name).to_contain_text("All Feeds")
 
-    def test_search_functionality_both_views(self, page: Page, test_server_url: str):
+    def test_search_functionality_both_views(self, loaded_page: Page, test_server_url: str):
         """Test that search works in both desktop and mobile chrome"""
 
-        page.goto(test_server_url)
-        page.wait_for_load_state("networkidle")
+        page = loaded_page
+
+        desktop_bar = page.locator("#desktop-icon-bar")
+        desktop_search = page.locator("#desktop-search-bar")
+        mobile_bar = page.locator("#mobile-icon-bar")
+        mobile_search = page.locator("#mobile-search-bar")
 
         # Desktop search test
         page.set_viewport_size({"width": 1400, "height": 900})
 
         # Click search button
-        page.locator("#desktop-icon-bar button[title='Search']").click()
-        page.wait_for_timeout(100)
+        desktop_bar.get_by_title("Search", exact=True).click()
 
         # Search bar should appear, icon bar should hide
-        expect(page.locator("#desktop-search-bar")).to_be_visible()
-        expect(page.locator("#desktop-icon-bar")).to_be_hidden()
+        expect(desktop_search).to_be_visible()
+        expect(desktop_bar).to_be_hidden()
 
         # Type in search
         search_input = page.locator("#desktop-search-input")
@@ -207,21 +232,20 @@ class TestUnifiedChromeResponsive:
         search_input.fill("Claude")
 
         # Close search
-        page.locator("#desktop-search-bar button[title='Close search']").click()
-        expect(page.locator("#desktop-search-bar")).to_be_hidden()
-        expect(page.locator("#desktop-icon-bar")).to_be_visible()
+        desktop_search.get_by_title("Close search", exact=True).click()
+        expect(desktop_search).to_be_hidden()
+        expect(desktop_bar).to_be_visible()
 
         # Mobile search test
         page.set_viewport_size({"width": 375, "height": 667})
-        page.wait_for_timeout(300)
+        wait_for_viewport(page, is_desktop=False)
 
         # Click search button
-        page.locator("#mobile-icon-bar button[title='Search']").click()
-        page.wait_for_timeout(100)
+        mobile_bar.get_by_title("Search", exact=True).click()
 
         # Search bar should appear, icon bar should hide
-        expect(page.locator("#mobile-search-bar")).to_be_visible()
-        expect(page.locator("#mobile-icon-bar")).to_be_hidden()
+        expect(mobile_search).to_be_visible()
+        expect(mobile_bar).to_be_hidden()
 
         # Type in search
         mobile_search_input = page.locator("#mobile-search-input")
@@ -229,6 +253,6 @@ class TestUnifiedChromeResponsive:
         mobile_search_input.fill("Hacker")
 
         # Close search
-        page.locator("#mobile-search-bar button[title='Close search']").click()
-        expect(page.locator("#mobile-search-bar")).to_be_hidden()
-        expect(page.locator("#mobile-icon-bar")).to_be_visible()
\ No newline at end of file
+        mobile_search.get_by_title("Close search", exact=True).click()
+        expect(mobile_search).to_be_hidden()
+        expect(mobile_bar).to_be_visible()
\ No newline at end of file
@@ -1,192 +1,257 @@
 """Comprehensive Playwright regression tests for RSS Reader refactoring validation"""
 
+import logging
 import pytest
 from playwright.sync_api import Page, expect
 import time
 import re
+from types import SimpleNamespace
+import test_constants as constants
+from test_helpers import (
+    assert_all_visible, click_if_present, follow_link, htmx_settled, resize_viewport, wait_for_page_ready,
+)
 
-pytestmark = pytest.mark.needs_server
+log = logging.getLogger(__name__)
 
-# HTMX Helper Functions for Fast Testing
-def wait_for_htmx_complete(page, timeout=5000):
-    """Wait for all HTMX requests to complete - much faster than fixed timeouts"""
-    page.wait_for_function("() => !document.body.classList.contains('htmx-request')", timeout=timeout)
+# Each test runs against its own worker's server, so the methods need not queue
+# behind each other on one worker. Tests share the worker's warm context and its
+# server session rather than paying the first-visit setup each time; read state
+# is cleared after each one. ``cold_start`` tests get a fresh context instead.
+pytestmark = [pytest.mark.needs_server, pytest.mark.fully_parallel, pytest.mark.warm_session]
 
-def wait_for_page_ready(page):
-    """Fast page ready check - waits for network idle instead of fixed timeout"""
-    page.wait_for_load_state("networkidle")
+
+@pytest.fixture(autouse=True)
+def primed_page(page, page_errors, request, test_server_url):
+    """Every test starts on the front page, loaded at its ``viewport`` marker's size
+    
+    The viewport is set before navigating so the first render is already the
+    right layout; unmarked tests keep the context's desktop viewport. The
+    session is already warm, so navigation only waits for the response to
+    commit and readiness is judged by the rendered form or hamburger. Any
+    JavaScript error from here on fails the test (see ``page_errors``).
+    """
+    viewport = request.node.get_closest_marker("viewport")
+    if viewport and page.viewport_size != viewport.args[0]:
+        page.set_viewport_size(viewport.args[0])
+    page.goto(test_server_url, wait_until="commit", timeout=constants.MAX_WAIT_MS)
+    wait_for_page_ready(page)
+    return page
+
+
+# Where a sidebar feed link (a plain <a href="/?feed_id=...">) lands
+FEED_URL_GLOB = "**feed_id=**"
+
+# Class on a tab's <li> while it is the selected one
+_UK_ACTIVE_RE = re.compile(r"uk-active")
+# All Posts adds unread=0 to the URL; Unread (the landing tab) drops it again
+_ALL_POSTS_URL_RE = re.compile(r"unread=0")
+
+def switch_desktop_tabs(page, all_posts_tab, unread_tab):
+    """Click the desktop All Posts tab, then Unread, checking each navigation landed
+    
+    Desktop tabs are plain links, so the URL is the proof a click did something;
+    no HTMX wait is involved.
+    """
+    all_posts_tab.click()
+    expect(page).to_have_url(_ALL_POSTS_URL_RE)
+    unread_tab.click()
+    expect(page).not_to_have_url(_ALL_POSTS_URL_RE)
+    expect(unread_tab.locator("..")).to_have_class(_UK_ACTIVE_RE)
+
+def first_item_id(page, test_server_url, sidebar_sel, layout, feed_index):
+    """Open the nth sidebar feed by URL and return the id of its first article
+    
+    Reads the feed ids off the sidebar hrefs in one call, then loads
+    ``/?feed_id=`` directly instead of clicking through the UI.
+    """
+    feed_ids = page.locator(f"{sidebar_sel} a[href*='feed_id']").evaluate_all(
+        "links => links.map(a => new URL(a.href).searchParams.get('feed_id'))")
+    if len(feed_ids) <= feed_index:
+        pytest.skip(f"Only {len(feed_ids)} feeds subscribed")
+    page.goto(f"{test_server_url}/?feed_id={feed_ids[feed_index]}", wait_until="domcontentloaded")
+    first_item = page.locator(f"li[id^='{layout}-feed-item-']").first
+    if first_item.count() == 0:
+        pytest.skip(f"Feed {feed_ids[feed_index]} has no articles")
+    item_id = first_item.get_attribute("id").rsplit("-", 1)[-1]
+    log.debug("Feed %s (index %d): first item %s", feed_ids[feed_index], feed_index, item_id)
+    return item_id
+
+
+# The desktop layout and its three columns
+DESKTOP_COLUMNS = ["#desktop-layout", "#sidebar", "#desktop-feeds-content", "#desktop-item-detail"]
+
+
+# Where each layout lists feeds, lists articles and shows the open article
+LAYOUT_SELECTORS = {
+    "desktop": {"sidebar": "#sidebar", "list": "#desktop-feeds-content", "detail": "#desktop-item-detail"},
+    "mobile": {"sidebar": "#mobile-sidebar", "list": "#main-content", "detail": "#main-content"},
+}
+
+WORKFLOW_LAYOUTS = [
+    pytest.param("desktop", id="desktop"),
+    pytest.param("mobile", id="mobile", marks=pytest.mark.viewport(constants.MOBILE_VIEWPORT)),
+]
+
+def _click_feed(page, layout, i):
+    """Click the ith sidebar feed of a layout, returning False if there is none
+    
+    On mobile the sidebar is opened through the hamburger first and must close
+    again once the feed has loaded.
+    """
+    sidebar_sel = LAYOUT_SELECTORS[layout]["sidebar"]
+    if layout == "mobile":
+        if not click_if_present(page.locator(HAMBURGER_SEL)):
+            return False
+        # Opened client-side, no request to wait for
+        expect(page.locator(sidebar_sel)).to_be_visible()
+    
+    feed_links = page.locator(f"{sidebar_sel} a[href*='feed_id']")
+    if feed_links.count() <= i:
+        return False
+    # Feed links are plain links: the click loads a whole new page
+    follow_link(page, feed_links.nth(i), FEED_URL_GLOB)
+    
+    if layout == "mobile":
+        expect(page.locator(sidebar_sel)).to_be_hidden()
+        expect(page.locator("li[id^='mobile-feed-item-']").first).to_be_visible()
+    return True
+
+def _click_article(page, layout, i):
+    """Click the ith article of the open feed and check it loaded, returning False if there is none"""
+    article_items = page.locator(f"li[id^='{layout}-feed-item-']")
+    if article_items.count() <= i:
+        return False
+    with htmx_settled(page):
+        article_items.nth(i).click()
+    
+    expect(page.locator(LAYOUT_SELECTORS[layout]["detail"])).to_contain_text("From:")
+    assert "/item/" in page.url
+    return True
 
 
+# Selectors the tests below reach for again and again
+DESKTOP_LAYOUT_SEL = "#desktop-layout"
+MOBILE_LAYOUT_SEL = "#mobile-layout"
+MOBILE_SIDEBAR_SEL = "#mobile-sidebar"
+HAMBURGER_SEL = "#mobile-nav-button"
+ITEM_DETAIL_SEL = "#desktop-item-detail"
+MAIN_CONTENT_SEL = "#main-content"
+DESKTOP_ARTICLES_SEL = "li[id*='desktop-feed-item']"
+
+@pytest.fixture
+def ui(page):
+    """The page's recurring locators, built once per test; they re-resolve lazily after swaps"""
+    return SimpleNamespace(
+        desktop_layout=page.locator(DESKTOP_LAYOUT_SEL),
+        mobile_layout=page.locator(MOBILE_LAYOUT_SEL),
+        mobile_sidebar=page.locator(MOBILE_SIDEBAR_SEL),
+        hamburger=page.locator(HAMBURGER_SEL),
+        item_detail=page.locator(ITEM_DETAIL_SEL),
+        main_content=page.locator(MAIN_CONTENT_SEL),
+        desktop_articles=page.locator(DESKTOP_ARTICLES_SEL),
+    )
+
 
 class TestComprehensiveRegression:
     """Comprehensive testing to detect regressions from HTMX architecture refactoring"""
     
-    def test_desktop_comprehensive_workflow(self, page: Page, test_server_url):
-        """Test complete desktop workflow: feed selection, article reading, tab switching"""
-        page.goto(test_server_url, timeout=10000)
-        page.set_viewport_size({"width": 1200, "height": 800})
-        
-        # Wait for page load
-        wait_for_page_ready(page)
-        # Page loads successfully (title may be default FastHTML page now)
-        
-        # Verify desktop three-column layout is visible
-        expect(page.locator("#desktop-layout")).to_be_visible()
-        expect(page.locator("#sidebar")).to_be_visible()
-        expect(page.locator("#desktop-feeds-content")).to_be_visible()
-        expect(page.locator("#desktop-item-detail")).to_be_visible()
-        
-        # Test Feed Selection Cycle (3 iterations)
-        for iteration in range(3):
-            print(f"Desktop iteration {iteration + 1}")
-            
-            # Click on a feed in sidebar (desktop version)
-            feed_links = page.locator("#sidebar a[href*='feed_id']").all()
-            if len(feed_links) > iteration:
-                feed_links[iteration].click()
-                
-                # Wait for feed content to load
-                wait_for_htmx_complete(page)
-                
-                # Scroll down in middle panel
-                middle_panel = page.locator("#desktop-feeds-content")
-                middle_panel.scroll_into_view_if_needed()
-                page.mouse.wheel(0, 500)
-                wait_for_htmx_complete(page, timeout=3000)
-                
-                # Click on an article
-                article_items = page.locator("#desktop-feeds-content li[id*='desktop-feed-item']").all()
-                if len(article_items) > 0:
-                    article_items[0].click()
-                    
-                    # Verify article loads in right panel
-                    wait_for_htmx_complete(page)
-                    expect(page.locator("#desktop-item-detail")).to_contain_text("From:")
-                    
-                    # Verify URL updated
-                    assert "/item/" in page.url
-                    
-                    # Toggle between All Posts and Unread tabs (use visible one for desktop)
-                    all_posts_tab = page.locator("#desktop-layout a:has-text('All Posts')").first
-                    unread_tab = page.locator("#desktop-layout a:has-text('Unread')").first
-                    
-                    if all_posts_tab.is_visible():
-                        all_posts_tab.click()
-                        wait_for_htmx_complete(page)
-                        
-                    if unread_tab.is_visible():
-                        unread_tab.click()
-                        wait_for_htmx_complete(page)
+    @pytest.mark.parametrize("layout", WORKFLOW_LAYOUTS)
+    def test_comprehensive_workflow(self, page: Page, ui, test_server_url, layout):
+        """Test the complete workflow: feed selection, article reading, tab switching
+        
+        The UI path is clicked through once per layout; every feed's item view
+        is reached by URL in the *_item_view_from_url tests.
+        """
+        if layout == "desktop":
+            # Verify desktop three-column layout is visible
+            assert_all_visible(page, DESKTOP_COLUMNS)
+        else:
+            expect(ui.mobile_layout).to_be_visible()
+            expect(ui.desktop_layout).to_be_hidden()
+        
+        if not _click_feed(page, layout, 0):
+            return
+        
+        # Scroll down the feed list to a concrete article rather than by a pixel
+        # guess; the list isn't lazy-loaded, so there is no HTMX request to await
+        page.locator(LAYOUT_SELECTORS[layout]["list"]).scroll_into_view_if_needed()
+        article_items = page.locator(f"li[id^='{layout}-feed-item-']")
+        article_count = article_items.count()
+        if article_count > 0:
+            article_items.nth(min(5, article_count - 1)).scroll_into_view_if_needed()
+        
+        if not _click_article(page, layout, 0):
+            return
+        
+        if layout == "mobile":
+            # The hamburger turns into a back arrow on the full-screen article
+            back_button = ui.hamburger
+            if back_button.is_visible():
+                with htmx_settled(page):
+                    back_button.click()
+        
+        # Toggle between All Posts and Unread tabs, waiting on the tab state rather than HTMX
+        all_posts_tab = page.locator(f"#{layout}-layout a:has-text('All Posts')").first
+        unread_tab = page.locator(f"#{layout}-layout a:has-text('Unread')").first
+        if layout == "desktop":
+            # Plain links: the URL proves each click navigated (Unread is the
+            # landing tab, so its active class alone would pass untouched)
+            switch_desktop_tabs(page, all_posts_tab, unread_tab)
+        else:
+            # HTMX tabs carry no hx-sync; fired together their swaps could land out of order
+            for tab in (all_posts_tab, unread_tab):
+                if click_if_present(tab):
+                    expect(tab.locator("..")).to_have_class(_UK_ACTIVE_RE)
     
-    def test_mobile_comprehensive_workflow(self, page: Page, test_server_url):
-        """Test complete mobile workflow: navigation, feed selection, article reading"""
-        page.goto(test_server_url, timeout=10000)
-        page.set_viewport_size({"width": 390, "height": 844})
-        
-        # Wait for page load and verify mobile layout
-        expect(page.locator("#mobile-layout")).to_be_visible()
-        expect(page.locator("#desktop-layout")).to_be_hidden()
-        
-        # Test Mobile Navigation Cycle (3 iterations)
-        for iteration in range(3):
-            print(f"Mobile iteration {iteration + 1}")
-            
-            # Open hamburger menu
-            hamburger = page.locator("#mobile-nav-button")
-            if hamburger.is_visible():
-                hamburger.click()
-                
-                # Wait for sidebar to open
-                wait_for_htmx_complete(page)
-                expect(page.locator("#mobile-sidebar")).to_be_visible()
-                
-                # Click on a feed
-                feed_links = page.locator("#mobile-sidebar a[href*='feed_id']").all()
-                if len(feed_links) > iteration % len(feed_links):
-                    feed_links[iteration % len(feed_links)].click()
-                    
-                    # Wait for sidebar to close and content to load
-                    page.wait_for_selector("li[id^='mobile-feed-item-']", state="visible", timeout=10000)
-                    expect(page.locator("#mobile-sidebar")).to_be_hidden()
-                    
-                    # Scroll down in feed list
-                    main_content = page.locator("#main-content")
-                    main_content.scroll_into_view_if_needed()
-                    page.mouse.wheel(0, 800)
-                    # Wait for any HTMX updates after scroll
-                    page.wait_for_selector("body:not(.htmx-request)", timeout=2000)
-                    
-                    # Click on an article
-                    article_items = page.locator("li[id*='mobile-feed-item']").all()
-                    if len(article_items) > 0:
-                        article_items[0].click()
-                        
-                        # Wait for article to load (full-screen mobile view)
-                        page.wait_for_selector("#main-content", state="visible", timeout=5000)
-                        
-                        # Verify article content is visible
-                        expect(page.locator("#main-content")).to_contain_text("From:")
-                        
-                        # Verify URL updated to article
-                        assert "/item/" in page.url
-                        
-                        # Click back arrow
-                        back_button = page.locator("#mobile-nav-button")
-                        if back_button.is_visible():
-                            back_button.click()
-                            
-                            # Wait for navigation back to feed list
-                            wait_for_htmx_complete(page)
-                            
-                            # Toggle between tabs (use visible one for mobile)
-                            all_posts_tab = page.locator("#mobile-layout a:has-text('All Posts')").first
-                            unread_tab = page.locator("#mobile-layout a:has-text('Unread')").first
-                            
-                            if all_posts_tab.is_visible():
-                                all_posts_tab.click()
-                                wait_for_htmx_complete(page)
-                                
-                            if unread_tab.is_visible():
-                                unread_tab.click()
-                                wait_for_htmx_complete(page)
+    # Each feed is its own test so xdist can run them side by side
+    @pytest.mark.parametrize("feed_index", range(constants.SEED_FEED_COUNT))
+    def test_desktop_item_view_from_url(self, page: Page, ui, test_server_url, feed_index):
+        """A feed's first article opened straight from its /item/ URL fills the detail column"""
+        item_id = first_item_id(page, test_server_url, "#sidebar", "desktop", feed_index)
+        page.goto(f"{test_server_url}/item/{item_id}", wait_until="domcontentloaded")
+        
+        expect(ui.item_detail).to_contain_text("From:")
+        assert_all_visible(page, DESKTOP_COLUMNS)
     
-    def test_responsive_layout_switching(self, page: Page, test_server_url):
-        """Test layout adaptation when switching between desktop and mobile viewports"""
-        page.goto(test_server_url, timeout=10000)
-        
-        # Start with desktop
-        page.set_viewport_size({"width": 1200, "height": 800})
-        expect(page.locator("#desktop-layout")).to_be_visible()
-        expect(page.locator("#mobile-layout")).to_be_hidden()
-        
+    @pytest.mark.parametrize("feed_index", range(constants.SEED_FEED_COUNT))
+    @pytest.mark.viewport(constants.MOBILE_VIEWPORT)
+    def test_mobile_item_view_from_url(self, page: Page, ui, test_server_url, feed_index):
+        """A feed's first article opened straight from its /item/ URL shows full screen on mobile"""
+        item_id = first_item_id(page, test_server_url, "#mobile-sidebar", "mobile", feed_index)
+        page.goto(f"{test_server_url}/item/{item_id}", wait_until="domcontentloaded")
+        
+        expect(ui.main_content).to_contain_text("From:")
+        expect(ui.desktop_layout).to_be_hidden()
+    
+    def test_desktop_layout_visible(self, page: Page, ui, test_server_url):
+        """Desktop viewport renders the desktop layout only"""
+        expect(ui.desktop_layout).to_be_visible()
+        expect(ui.mobile_layout).to_be_hidden()
+    
+    @pytest.mark.viewport(constants.MOBILE_VIEWPORT)
+    def test_mobile_layout_visible(self, page: Page, ui, test_server_url):
+        """Mobile viewport renders the mobile layout only"""
+        expect(ui.mobile_layout).to_be_visible()
+        expect(ui.desktop_layout).to_be_hidden()
+    
+    def test_responsive_layout_switching(self, page: Page, ui, test_server_url):
+        """Test an open article survives shrinking the window to the mobile layout"""
         # Click an article in desktop mode
-        article_items = page.locator("li[id*='desktop-feed-item']").all()
-        if len(article_items) > 0:
-            article_items[0].click()
-            page.wait_for_selector("#desktop-item-detail", state="visible", timeout=5000)
-            expect(page.locator("#desktop-item-detail")).to_contain_text("From:")
-        
-        # Switch to mobile viewport
-        page.set_viewport_size({"width": 390, "height": 844})
-        wait_for_htmx_complete(page)
-        
-        expect(page.locator("#mobile-layout")).to_be_visible()
-        expect(page.locator("#desktop-layout")).to_be_hidden()
+        article_items = ui.desktop_articles
+        if article_items.count() > 0:
+            with htmx_settled(page):
+                article_items.first.click()
+            expect(ui.item_detail).to_contain_text("From:")
         
-        # Switch back to desktop
-        page.set_viewport_size({"width": 1200, "height": 800})
-        wait_for_htmx_complete(page)
+        # Switch to mobile viewport - a CSS-only change, done once the relayout is observed
+        resize_viewport(page, constants.MOBILE_VIEWPORT)
         
-        expect(page.locator("#desktop-layout")).to_be_visible()
-        expect(page.locator("#mobile-layout")).to_be_hidden()
+        expect(ui.mobile_layout).to_be_visible()
+        expect(ui.desktop_layout).to_be_hidden()
     
+    @pytest.mark.cold_start  # Counts unread dots, so reads from other tests' shared session would skew it
     def test_htmx_state_management(self, page: Page, test_server_url):
         """Test HTMX state updates and out-of-band swaps"""
-        page.goto(test_server_url, timeout=10000)
-        page.set_viewport_size({"width": 1200, "height": 800})
-        
-        # Wait for page load
-        wait_for_htmx_complete(page)
         
         # Test blue indicator state changes
         unread_items = page.locator("#desktop-feeds-content li[id*='feed-item'] .w-2.h-2.bg-blue-500")
@@ -195,59 +260,44 @@ class TestComprehensiveRegression:
         if initial_count > 0:
             # Click an unread article
             first_unread_item = page.locator("#desktop-feeds-content li[id*='feed-item']:has(.w-2.h-2.bg-blue-500)").first
-            first_unread_item.click()
-            
             # Wait for HTMX update
-            wait_for_htmx_complete(page)
+            with htmx_settled(page):
+                first_unread_item.click()
             
             # Verify blue dot disappeared (out-of-band update)
             final_count = unread_items.count()
             assert final_count < initial_count, "Blue indicator should disappear after reading"
     
-    def test_rapid_interaction_stability(self, page: Page, test_server_url):
+    def test_rapid_interaction_stability(self, page: Page, page_errors, test_server_url):
         """Test stability under rapid user interactions"""
-        page.goto(test_server_url, timeout=10000)
-        page.set_viewport_size({"width": 1200, "height": 800})
-        
-        # Wait for initial load
-        wait_for_htmx_complete(page)
+        # In desktop mode (1200x800), feed links are in the sidebar
+        # No need to open mobile sidebar in desktop mode. Bound once: locators
+        # re-resolve on every click, and the sidebar's feed list doesn't change.
+        feed_links = page.locator("#sidebar a[href*='feed_id']")
+        feed_count = feed_links.count()
+        article_items = page.locator("li[id^='desktop-feed-item-']")
         
         # Rapid clicking test
         for i in range(5):
-            # In desktop mode (1200x800), feed links are in the sidebar
-            # No need to open mobile sidebar in desktop mode
-            feed_links = page.locator("#sidebar a[href*='feed_id']").all()
-            if len(feed_links) > 0:
-                feed_links[i % len(feed_links)].click()
-                wait_for_htmx_complete(page)
+            if feed_count > 0:
+                follow_link(page, feed_links.nth(i % feed_count), FEED_URL_GLOB)
             
             # Quick article clicks (desktop layout)
-            article_items = page.locator("li[id^='desktop-feed-item-']").all()
-            if len(article_items) > 0:
-                article_items[0].click()
-                wait_for_htmx_complete(page)
+            if article_items.count() > 0:
+                with htmx_settled(page):
+                    article_items.first.click()
         
         # Verify app is still responsive
         # Page loads successfully (title may be default FastHTML page now)
         
-        # Check for JavaScript errors
-        errors = []
-        page.on("pageerror", lambda error: errors.append(str(error)))
-        wait_for_htmx_complete(page)
-        
-        assert len(errors) == 0, f"JavaScript errors detected: {errors}"
+        # pageerror events are delivered by the time each settled click returns
+        assert len(page_errors) == 0, f"JavaScript errors detected: {page_errors}"
     
     # NOTE: test_mobile_sidebar_and_navigation_flow moved to test_mobile_sidebar_isolated.py
     # due to race conditions with parallel test execution
     
     def test_feed_content_and_pagination(self, page: Page, test_server_url):
         """Test feed content loading and pagination behavior"""
-        page.goto(test_server_url, timeout=10000)
-        page.set_viewport_size({"width": 1200, "height": 800})
-        
-        # Wait for content load
-        wait_for_page_ready(page)
-        
         # Verify feed content is present
         feed_items = page.locator("li[id*='feed-item']")
         expect(feed_items.first).to_be_visible()
@@ -256,78 +306,60 @@ class TestComprehensiveRegression:
         all_posts_tab = page.locator("#desktop-feeds-content a:has-text('All Posts')")
         unread_tab = page.locator("#desktop-feeds-content a:has-text('Unread')")
         
-        # Switch to All Posts
-        if all_posts_tab.is_visible():
-            all_posts_tab.click()
-            wait_for_htmx_complete(page)
-            expect(all_posts_tab.locator("..")).to_have_class(re.compile(r"uk-active"))
-        
-        # Switch to Unread
-        if unread_tab.is_visible():
-            unread_tab.click()
-            wait_for_htmx_complete(page)
-            expect(unread_tab.locator("..")).to_have_class(re.compile(r"uk-active"))
+        # Switch to All Posts, then back to Unread
+        switch_desktop_tabs(page, all_posts_tab, unread_tab)
     
-    def test_session_and_state_persistence(self, page: Page, test_server_url):
+    @pytest.mark.cold_start  # Exercises session setup itself
+    def test_session_and_state_persistence(self, page: Page, ui, test_server_url):
         """Test session management and state persistence across navigation"""
-        page.goto(test_server_url, timeout=10000)
-        
-        # Wait for initial session setup
-        wait_for_page_ready(page)
-        
         # Navigate to different feeds and verify session persists
         # Handle both desktop and mobile layouts
         mobile_nav_button = page.locator("button#mobile-nav-button")
+        mobile_sidebar = ui.mobile_sidebar
         is_mobile = mobile_nav_button.is_visible()
         
         if is_mobile:
             # Mobile: open sidebar and get mobile feed links
             mobile_nav_button.click()
-            wait_for_htmx_complete(page)
-            feed_links = page.locator("#mobile-sidebar a[href*='feed_id']").all()
+            expect(mobile_sidebar).to_be_visible()
+            feed_links = mobile_sidebar.locator("a[href*='feed_id']")
+            article_items = page.locator("li[id*='mobile-feed-item']")
         else:
             # Desktop: get sidebar feed links directly
-            feed_links = page.locator("#sidebar a[href*='feed_id']").all()
+            feed_links = page.locator("#sidebar a[href*='feed_id']")
+            article_items = ui.desktop_articles
         
-        for i, feed_link in enumerate(feed_links[:2]):  # Test first 2 feeds
+        for i in range(min(feed_links.count(), 2)):  # Test first 2 feeds
+            feed_link = feed_links.nth(i)  # Re-resolved after each goto back to the main page
             # Reopen mobile sidebar before each feed click if mobile
-            if is_mobile and not page.locator("#mobile-sidebar").is_visible():
+            if is_mobile and not mobile_sidebar.is_visible():
                 mobile_nav_button.click()
-                wait_for_htmx_complete(page)
+                expect(mobile_sidebar).to_be_visible()
                 
-            feed_link.click()
-            wait_for_htmx_complete(page)
+            follow_link(page, feed_link, FEED_URL_GLOB)
             
             # Verify feed page loads and session is maintained
             # Page loads successfully (title may be default FastHTML page now)
             assert "feed_id" in page.url
             
-            # Click an article to test state management
-            # Use the correct selector based on viewport
-            if is_mobile:
-                article_items = page.locator("li[id*='mobile-feed-item']").all()
-            else:
-                article_items = page.locator("li[id*='desktop-feed-item']").all()
-
-            if len(article_items) > 0:
-                article_items[0].click()
-                wait_for_htmx_complete(page)
-                wait_for_htmx_complete(page)  # Additional wait for URL update
+            # Click an article to test state management (selector picked for the viewport above)
+            if article_items.count() > 0:
+                article_items.first.click()
+                page.wait_for_url("**/item/**", timeout=constants.HTMX_WAIT_MS)  # pushState lands after the swap
 
                 # Verify article loads
                 assert "/item/" in page.url
                 
                 # Go back to main page
-                page.goto(test_server_url, timeout=10000)
+                page.goto(test_server_url, wait_until="commit", timeout=constants.MAX_WAIT_MS)
                 wait_for_page_ready(page)
     
+    @pytest.mark.cold_start  # Error pages must not depend on a session another test set up
     def test_error_resilience_and_recovery(self, page: Page, test_server_url):
         """Test application resilience under various error conditions"""
-        page.goto(test_server_url, timeout=10000)
-        
         # Test invalid item URL (use very high number unlikely to exist)
         invalid_item_id = 999999
-        page.goto(f"{test_server_url}/item/{invalid_item_id}", timeout=10000)
+        page.goto(f"{test_server_url}/item/{invalid_item_id}", wait_until="commit", timeout=constants.MAX_WAIT_MS)
         wait_for_page_ready(page)
         
         # Should gracefully handle non-existent items
@@ -335,14 +367,14 @@ class TestComprehensiveRegression:
         
         # Test invalid feed ID (use very high number unlikely to exist)
         invalid_feed_id = 999999
-        page.goto(f"{test_server_url}/?feed_id={invalid_feed_id}", timeout=10000)
+        page.goto(f"{test_server_url}/?feed_id={invalid_feed_id}", wait_until="commit", timeout=constants.MAX_WAIT_MS)
         wait_for_page_ready(page)
         
         # Should gracefully handle invalid feed IDs
         # Page loads successfully (title may be default FastHTML page now)
         
         # Return to valid state
-        page.goto(test_server_url, timeout=10000)
+        page.goto(test_server_url, wait_until="commit", timeout=constants.MAX_WAIT_MS)
         wait_for_page_ready(page)
         # Page loads successfully (title may be default FastHTML page now)
 
@@ -350,56 +382,20 @@ class TestComprehensiveRegression:
 class TestHTMXArchitectureValidation:
     """Validate HTMX architecture changes work correctly"""
     
-    def test_mobile_handlers_routing(self, page: Page, test_server_url):
-        """Test MobileHandlers routing and content swapping"""
-        page.goto(test_server_url, timeout=10000)
-        page.set_viewport_size({"width": 390, "height": 844})
-        
-        # Test mobile content handler
-        expect(page.locator("#main-content")).to_be_visible()
-        
-        # Test mobile sidebar handler
-        hamburger = page.locator("#mobile-nav-button")
-        if hamburger.is_visible():
-            hamburger.click()
-            expect(page.locator("#mobile-sidebar")).to_be_visible()
-            
-            # Close sidebar
-            close_button = page.locator("#mobile-sidebar button[hx-on-click*='setAttribute']")
-            close_button.click()
-            expect(page.locator("#mobile-sidebar")).to_be_hidden()
-    
-    def test_desktop_handlers_routing(self, page: Page, test_server_url):
-        """Test DesktopHandlers routing and column updates"""
-        page.goto(test_server_url, timeout=10000)
-        page.set_viewport_size({"width": 1200, "height": 800})
-        
-        # Test desktop feeds column handler
-        expect(page.locator("#desktop-feeds-content")).to_be_visible()
-        
-        # Test desktop detail column handler
-        expect(page.locator("#desktop-item-detail")).to_be_visible()
-        
-        # Test desktop sidebar column handler
-        expect(page.locator("#sidebar")).to_be_visible()
+    def test_desktop_architecture(self, page: Page, ui, test_server_url):
+        """Test DesktopHandlers column updates and the desktop tab container on one page load"""
+        # Test desktop feeds, detail and sidebar column handlers
+        assert_all_visible(page, DESKTOP_COLUMNS)
         
         # Test column interaction
-        article_items = page.locator("li[id*='desktop-feed-item']").all()
-        if len(article_items) > 0:
-            article_items[0].click()
-            wait_for_htmx_complete(page)
+        article_items = ui.desktop_articles
+        if article_items.count() > 0:
+            with htmx_settled(page):
+                article_items.first.click()
             
             # Verify detail column updates while other columns remain
-            expect(page.locator("#desktop-item-detail")).to_contain_text("From:")
-            expect(page.locator("#desktop-feeds-content")).to_be_visible()
-            expect(page.locator("#sidebar")).to_be_visible()
-    
-    def test_unified_tab_container_behavior(self, page: Page, test_server_url):
-        """Test the unified create_tab_container function for both mobile and desktop"""
-        # Test desktop tab behavior
-        page.goto(test_server_url, timeout=10000)
-        page.set_viewport_size({"width": 1200, "height": 800})
-        wait_for_page_ready(page)
+            expect(ui.item_detail).to_contain_text("From:")
+            assert_all_visible(page, DESKTOP_COLUMNS)
         
         # Desktop tabs should use regular links (no HTMX)
         all_posts_desktop = page.locator("#desktop-feeds-content a:has-text('All Posts')").first
@@ -407,11 +403,23 @@ class TestHTMXArchitectureValidation:
             # Should have href but no hx-get for desktop
             expect(all_posts_desktop).to_have_attribute("href", "/?unread=0")
             all_posts_desktop.click()
-            wait_for_htmx_complete(page)
+            page.wait_for_url("**/?unread=0", timeout=constants.HTMX_WAIT_MS)
+    
+    @pytest.mark.viewport(constants.MOBILE_VIEWPORT)
+    def test_mobile_architecture(self, page: Page, ui, test_server_url):
+        """Test MobileHandlers content/sidebar swapping and the mobile tab container on one page load"""
+        # Test mobile content handler
+        expect(ui.main_content).to_be_visible()
         
-        # Test mobile tab behavior
-        page.set_viewport_size({"width": 390, "height": 844})
-        wait_for_page_ready(page)
+        # Test mobile sidebar handler
+        hamburger = ui.hamburger
+        if click_if_present(hamburger):
+            expect(ui.mobile_sidebar).to_be_visible()
+            
+            # Close sidebar
+            close_button = page.locator("#mobile-sidebar button[hx-on-click*='setAttribute']")
+            close_button.click()
+            expect(ui.mobile_sidebar).to_be_hidden()
         
         # Mobile tabs should use HTMX attributes
         all_posts_mobile = page.locator("#mobile-persistent-header a:has-text('All Posts')").first
@@ -419,5 +427,5 @@ class TestHTMXArchitectureValidation:
             # Should have both href and hx-get for mobile
             expect(all_posts_mobile).to_have_attribute("href", "/?unread=0")
             expect(all_posts_mobile).to_have_attribute("hx-get", "/?unread=0")
-            all_posts_mobile.click()
-            wait_for_htmx_complete(page)
\ No newline at end of file
+            with htmx_settled(page):
+                all_posts_mobile.click()
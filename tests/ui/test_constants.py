@@ -0,0 +1,18 @@
+"""Shared viewport sizes and timeouts for the UI test suite
+
+Tuning a wait here tunes it for every test that imports it, e.g.
+``import test_constants as constants``.
+"""
+
+# Viewports
+DESKTOP_VIEWPORT = {"width": 1200, "height": 800}
+DESKTOP_VIEWPORT_ALT = {"width": 1400, "height": 900}
+MOBILE_VIEWPORT = {"width": 390, "height": 844}  # iPhone 12 Pro
+MOBILE_VIEWPORT_ALT = {"width": 375, "height": 667}  # iPhone SE
+
+# Timeouts (ms)
+MAX_WAIT_MS = 10000  # Navigation and first render
+HTMX_WAIT_MS = 2500  # A single HTMX request/swap against the local test server
+
+# Test data
+SEED_FEED_COUNT = 2  # Feeds in data/minimal_seed.db, which every worker's server starts from
@@ -0,0 +1,139 @@
+"""Shared HTMX/DOM wait helpers for the UI test suite
+
+Event-driven replacements for ``wait_for_load_state("networkidle")``, which
+always idles 500ms and never settles on pages with background requests.
+Import as ``from test_helpers import wait_for_htmx_complete``.
+"""
+
+from contextlib import contextmanager
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+import test_constants as constants
+
+# Desktop add feed input or mobile hamburger - whichever the viewport renders
+PAGE_READY_SEL = "#sidebar input[name='new_feed_url']:visible, #mobile-nav-button:visible"
+# Desktop chrome or mobile top bar - whichever the viewport renders
+CHROME_READY_SEL = "#desktop-chrome-container:visible, #mobile-top-bar:visible"
+
+# Selectors from the argument list that don't resolve to a rendered element
+_HIDDEN_SELECTORS_JS = "(sels) => sels.filter(s => { const el = document.querySelector(s); return !el || !el.checkVisibility(); })"
+
+
+def wait_for_htmx_complete(page, timeout=constants.HTMX_WAIT_MS):
+    """Wait for in-flight HTMX requests - resolves the moment the last htmx-request class is dropped
+
+    HTMX puts ``htmx-request`` on the element that issued the request (or its
+    indicator), so the observer watches class changes across the whole document.
+    """
+    page.evaluate("""(timeout) => new Promise((resolve, reject) => {
+        const busy = () => document.querySelector('.htmx-request') !== null;
+        if (!busy()) return resolve();
+        const obs = new MutationObserver(() => {
+            if (!busy()) {
+                clearTimeout(timer);
+                obs.disconnect();
+                resolve();
+            }
+        });
+        const timer = setTimeout(() => { obs.disconnect(); reject(new Error('htmx-request still set after ' + timeout + 'ms')); }, timeout);
+        obs.observe(document.documentElement, {attributes: true, attributeFilter: ['class'], subtree: true});
+    })""", timeout)
+
+
+def wait_for_quiet(page, timeout=constants.MAX_WAIT_MS):
+    """Wait until the page has loaded and no fetch/XHR (HTMX included) is in flight
+
+    Reads the counter conftest's INFLIGHT_COUNTER_JS installs on every context,
+    so it returns as soon as the last request settles - no networkidle 500ms
+    window. On pages without the counter only the load and HTMX checks apply.
+    """
+    page.wait_for_function("""() => document.readyState === 'complete'
+        && (window.__inflight ? window.__inflight() : 0) === 0
+        && document.querySelector('.htmx-request') === null""", timeout=timeout)
+
+
+@contextmanager
+def htmx_settled(page, timeout=constants.HTMX_WAIT_MS):
+    """Wait for the ``htmx:afterSettle`` triggered by the action inside the block
+
+    The listener is armed before the block runs, so a swap that settles faster
+    than the next CDP round trip is still seen::
+
+        with htmx_settled(page):
+            article_item.click()
+
+    Only for real HTMX triggers: a plain link loads a new document, which has no
+    armed listener, so the wait fails instead of passing - use ``follow_link``.
+    """
+    page.evaluate("""() => {
+        window.__htmxSettled = new Promise(r => document.addEventListener('htmx:afterSettle', () => r(true), {once: true}));
+    }""")
+    yield
+    page.evaluate("""(timeout) => {
+        if (!window.__htmxSettled) throw new Error('htmx_settled: the page navigated instead of swapping - plain links need follow_link()');
+        return Promise.race([
+            window.__htmxSettled,
+            new Promise((_, reject) => setTimeout(() => reject(new Error('no htmx:afterSettle within ' + timeout + 'ms')), timeout)),
+        ]);
+    }""", timeout)
+
+
+def follow_link(page, link, url, timeout=constants.MAX_WAIT_MS):
+    """Click a plain (non-HTMX) link and wait for the new page to load and render
+
+    ``url`` is a glob or regex the destination must match, e.g. ``"**feed_id=**"``.
+    """
+    link.click()
+    page.wait_for_url(url, timeout=timeout)
+    wait_for_page_ready(page, timeout)
+
+
+def resize_viewport(page, size, timeout=constants.HTMX_WAIT_MS):
+    """Resize the viewport and return after the first frame laid out at the new width
+
+    One Emulation call plus one evaluate: the in-page wait resolves on the next
+    animation frame once ``innerWidth`` matches. Nothing is done when the page
+    is already at ``size`` - Playwright doesn't skip identical resizes itself.
+    """
+    if page.viewport_size == size:
+        return
+    page.set_viewport_size(size)
+    page.evaluate("""([width, timeout]) => new Promise((resolve, reject) => {
+        const timer = setTimeout(() => reject(new Error('no resize within ' + timeout + 'ms')), timeout);
+        const check = () => window.innerWidth === width ? (clearTimeout(timer), resolve()) : requestAnimationFrame(check);
+        requestAnimationFrame(check);
+    })""", [size["width"], timeout])
+
+
+def click_if_present(locator, timeout=500):
+    """Click the element if it becomes visible within ``timeout``, returning whether it did
+
+    Only the presence check is bounded by ``timeout``; the click itself runs on the
+    default timeout, so a slow page load the click starts (plain links under
+    ``-n auto``) is never mistaken for "not present".
+    """
+    try:
+        locator.wait_for(state="visible", timeout=timeout)
+    except PlaywrightTimeoutError:
+        return False
+    locator.click()
+    return True
+
+
+def wait_for_page_ready(page, timeout=constants.MAX_WAIT_MS):
+    """Wait for the add feed form (desktop) or the hamburger (mobile) to render"""
+    page.locator(PAGE_READY_SEL).first.wait_for(state="visible", timeout=timeout)
+
+
+def wait_for_chrome_ready(page, timeout=constants.MAX_WAIT_MS):
+    """Wait for the feed list chrome of the current viewport to render"""
+    page.locator(CHROME_READY_SEL).first.wait_for(state="visible", timeout=timeout)
+
+
+def assert_all_visible(page, selectors, timeout=constants.HTMX_WAIT_MS):
+    """Assert every selector is visible, polled in-page as one wait instead of an expect() per locator"""
+    try:
+        page.wait_for_function(f"(sels) => ({_HIDDEN_SELECTORS_JS})(sels).length === 0", arg=selectors, timeout=timeout)
+    except PlaywrightTimeoutError:
+        hidden = page.evaluate(_HIDDEN_SELECTORS_JS, selectors)
+        raise AssertionError(f"Not visible after {timeout}ms: {hidden}") from None
@@ -9,19 +9,11 @@ Combines functionality from:
 
 import pytest
 from playwright.sync_api import Page, expect
+from test_helpers import click_if_present, wait_for_htmx_complete, wait_for_quiet
 import time
 
 pytestmark = pytest.mark.needs_server
 
-# HTMX Helper Functions for Fast Testing
-def wait_for_htmx_complete(page, timeout=5000):
-    """Wait for all HTMX requests to complete - much faster than fixed timeouts"""
-    page.wait_for_function("() => !document.body.classList.contains('htmx-request')", timeout=timeout)
-
-def wait_for_page_ready(page):
-    """Fast page ready check - waits for network idle instead of fixed timeout"""
-    page.wait_for_load_state("networkidle")
-
 
 class TestMobileFlows:
     """Test mobile-specific UI flows and behaviors"""
@@ -33,7 +25,7 @@ class TestMobileFlows:
         page.goto(test_server_url, timeout=10000)
         # Wait for mobile layout to be visible
         page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
-        wait_for_page_ready(page)  # OPTIMIZED: Wait for network idle
+        wait_for_quiet(page)  # OPTIMIZED: Wait for in-flight requests to settle
     
     # Navigation Tests (from test_mobile_navigation.py)
     def test_mobile_post_navigation_htmx(self, page: Page, test_server_url):
@@ -338,13 +330,13 @@ class TestMobileFlows:
         page.goto(test_server_url, timeout=10000)
         # Wait for mobile layout to be visible
         page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
-        wait_for_page_ready(page)  # FIXED: Don't expect sidebar visible on main page
+        wait_for_quiet(page)  # FIXED: Don't expect sidebar visible on main page
         
         # Now navigate directly to the article URL
         page.goto(article_url, timeout=10000)
         # Wait for article detail to be visible
         page.wait_for_selector("#item-detail", state="visible", timeout=5000)
-        wait_for_page_ready(page)
+        wait_for_quiet(page)
         
         # Should show the same article
         expect(page.locator("#main-content #item-detail")).to_be_visible()
@@ -385,13 +377,13 @@ class TestMobileFlows:
             page.goto(test_server_url, timeout=10000)
             # Wait for mobile layout to be visible
             page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
-            wait_for_page_ready(page)  # OPTIMIZED: Wait for page to load, sidebar is hidden by default
+            wait_for_quiet(page)  # OPTIMIZED: Wait for page to load, sidebar is hidden by default
             
             # Navigate directly to the feed URL
             page.goto(current_url, timeout=10000)
             # Wait for mobile layout to be visible
             page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
-            wait_for_page_ready(page)
+            wait_for_quiet(page)
             
             # Should be back on the filtered view
             assert "feed_id=" in page.url, "Should maintain feed filter"
@@ -405,8 +397,7 @@ class TestMobileFlows:
         
         # Click on Unread tab if available
         unread_tab = page.locator('a[role="button"]:has-text("Unread")').first
-        if unread_tab.is_visible():
-            unread_tab.click()
+        if click_if_present(unread_tab):
             wait_for_htmx_complete(page)
             
             # Should have unread parameter in URL
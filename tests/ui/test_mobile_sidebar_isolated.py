@@ -13,68 +13,56 @@ Rather than complex cleanup logic, simpler to run this test separately.
 
 import pytest
 from playwright.sync_api import Page, expect
+from test_helpers import click_if_present, wait_for_htmx_complete, wait_for_quiet
 import time
 
 pytestmark = pytest.mark.needs_server
 
-# HTMX Helper Functions
-def wait_for_htmx_complete(page, timeout=5000):
-    """Wait for all HTMX requests to complete"""
-    page.wait_for_function("() => !document.body.classList.contains('htmx-request')", timeout=timeout)
-
-def wait_for_page_ready(page):
-    """Wait for page ready state"""
-    page.wait_for_load_state("networkidle")
-
 
 class TestMobileSidebarIsolated:
     """Mobile sidebar tests that need isolation from parallel execution"""
     
-    def test_mobile_sidebar_and_navigation_flow(self, page: Page, test_server_url):
+    @pytest.mark.parametrize("i", range(3))
+    def test_mobile_sidebar_and_navigation_flow(self, page: Page, test_server_url, i):
         """Test mobile-specific navigation patterns"""
         page.set_viewport_size({"width": 390, "height": 844})
         page.goto(test_server_url, timeout=10000)
         # Wait for specific mobile layout element
         page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
-        wait_for_page_ready(page)
+        wait_for_quiet(page)
         
         # Ensure mobile layout and JavaScript are ready
         expect(page.locator("#mobile-layout")).to_be_visible()
         expect(page.locator("#mobile-nav-button")).to_be_visible()
         wait_for_htmx_complete(page)  # Ensure JS is loaded
         
-        # Test sidebar open/close cycle
-        for i in range(3):
-            # Open sidebar with hamburger
-            hamburger = page.locator("#mobile-nav-button")
-            if hamburger.is_visible():
-                hamburger.click()
-                page.wait_for_selector("#mobile-sidebar", state="visible")  # Wait for sidebar to become visible
+        # Open sidebar with hamburger (one feed per parametrized iteration)
+        hamburger = page.locator("#mobile-nav-button")
+        if click_if_present(hamburger):
+            page.wait_for_selector("#mobile-sidebar", state="visible")  # Wait for sidebar to become visible
+            
+            # Select different feed each iteration
+            feed_links = page.locator("#mobile-sidebar a[href*='feed_id']")
+            feed_count = feed_links.count()
+            if feed_count > 0:
+                feed_links.nth(i % feed_count).click()
+                
+                # Verify sidebar closes and content updates
+                wait_for_htmx_complete(page)
+                expect(page.locator("#mobile-sidebar")).to_be_hidden()
                 
-                # Select different feed each iteration
-                feed_links = page.locator("#mobile-sidebar a[href*='feed_id']").all()
-                if len(feed_links) > i % len(feed_links):
-                    feed_links[i % len(feed_links)].click()
+                # Test article navigation
+                article_items = page.locator("li[id*='mobile-feed-item']")
+                if article_items.count() > 0:
+                    article_items.first.click()
                     
-                    # Verify sidebar closes and content updates
-                    wait_for_htmx_complete(page)
-                    expect(page.locator("#mobile-sidebar")).to_be_hidden()
+                    # Verify full-screen article view (pushState lands after the swap)
+                    page.wait_for_url("**/item/**", timeout=5000)
                     
-                    # Test article navigation
-                    article_items = page.locator("li[id*='mobile-feed-item']").all()
-                    if len(article_items) > 0:
-                        article_items[0].click()
-                        
-                        # Verify full-screen article view
+                    # Navigate back
+                    back_button = hamburger  # The nav button turns into the back arrow in article view
+                    if click_if_present(back_button):
                         wait_for_htmx_complete(page)
-                        wait_for_htmx_complete(page)  # Additional wait for URL update
-                        assert "/item/" in page.url
-                        
-                        # Navigate back
-                        back_button = page.locator("#mobile-nav-button")
-                        if back_button.is_visible():
-                            back_button.click()
-                            wait_for_htmx_complete(page)
 
 
 if __name__ == "__main__":
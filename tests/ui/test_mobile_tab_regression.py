@@ -3,15 +3,10 @@
 import pytest
 import re
 from playwright.sync_api import Page, expect
+from test_helpers import wait_for_htmx_complete, wait_for_quiet
 
-# HTMX Helper Functions for Fast Testing
-def wait_for_htmx_complete(page, timeout=5000):
-    """Wait for all HTMX requests to complete - much faster than fixed timeouts"""
-    page.wait_for_function("() => !document.body.classList.contains('htmx-request')", timeout=timeout)
-
-def wait_for_page_ready(page):
-    """Fast page ready check - waits for network idle instead of fixed timeout"""
-    page.wait_for_load_state("networkidle")
+# URL once the All Posts view is showing
+_ALL_POSTS_URL_RE = re.compile(r'.*unread=0.*')
 
 
 def test_mobile_tab_active_style_updates(page: Page, test_server_url):
@@ -22,7 +17,7 @@ def test_mobile_tab_active_style_updates(page: Page, test_server_url):
     page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
 
     # Wait for page load
-    wait_for_page_ready(page)
+    wait_for_quiet(page)
     
     # Find the navigation buttons in mobile icon bar (new structure)
     # Mobile viewport test - use mobile-specific selectors
@@ -39,7 +34,7 @@ def test_mobile_tab_active_style_updates(page: Page, test_server_url):
     wait_for_htmx_complete(page)
     
     # Check URL changed to show all posts
-    expect(page).to_have_url(re.compile(r'.*unread=0.*'))
+    expect(page).to_have_url(_ALL_POSTS_URL_RE)
     print("✅ All Posts navigation working - URL updated to show all posts")
     
     # Test 2: Click Unread - should navigate back to unread view  
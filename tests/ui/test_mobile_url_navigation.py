@@ -4,15 +4,7 @@ CRITICAL: Tests scroll position preservation, chevron/hamburger toggle, header v
 
 import pytest
 from playwright.sync_api import Page, expect
-
-# HTMX Helper Functions for Fast Testing
-def wait_for_htmx_complete(page, timeout=5000):
-    """Wait for all HTMX requests to complete - much faster than fixed timeouts"""
-    page.wait_for_function("() => !document.body.classList.contains('htmx-request')", timeout=timeout)
-
-def wait_for_page_ready(page):
-    """Fast page ready check - waits for network idle instead of fixed timeout"""
-    page.wait_for_load_state("networkidle")
+from test_helpers import wait_for_htmx_complete, wait_for_quiet
 
 
 class TestMobileNavigationComplete:
@@ -25,10 +17,11 @@ class TestMobileNavigationComplete:
         page.set_viewport_size({"width": 390, "height": 844})  # iPhone 13 size
         
         # Navigate to clean starting state (preserves session cookies automatically)
-        page.goto(f"{test_server_url}/?unread=0", wait_until="networkidle", timeout=10000)
+        page.goto(f"{test_server_url}/?unread=0", timeout=10000)
+        wait_for_quiet(page)
         # Wait for specific mobile layout element
         page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
-        wait_for_page_ready(page)
+        wait_for_quiet(page)
         
         # Ensure clean DOM state - mobile sidebar should be closed by default
         page.evaluate("""() => {
@@ -52,7 +45,7 @@ class TestMobileNavigationComplete:
         page.goto(f"{test_server_url}/?unread=0", timeout=10000)
         # Wait for specific mobile layout element
         page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
-        wait_for_page_ready(page)
+        wait_for_quiet(page)
         
         # CRITICAL: Set and verify scroll position on the feeds list container
         scroll_setup = page.evaluate("""() => {
@@ -171,7 +164,7 @@ class TestMobileNavigationComplete:
         page.goto(f"{test_server_url}/?unread=0", timeout=10000)
         # Wait for specific mobile layout element
         page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
-        wait_for_page_ready(page)
+        wait_for_quiet(page)
         
         # Test navigation by direct URL (more reliable than element clicking)
         # Simulate: list view -> article view -> back to list
@@ -208,7 +201,7 @@ class TestMobileNavigationComplete:
         page.goto(f"{test_server_url}/?unread=0", timeout=10000)
         # Wait for specific mobile layout element
         page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
-        wait_for_page_ready(page)
+        wait_for_quiet(page)
         
         # Verify hamburger restored
         hamburger_icon = page.evaluate("""() => {
@@ -232,7 +225,7 @@ class TestMobileNavigationComplete:
         page.goto(f"{test_server_url}/?unread=0", timeout=10000)
         # Wait for specific mobile layout element
         page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
-        wait_for_page_ready(page)
+        wait_for_quiet(page)
         
         mobile_header = page.locator('#mobile-persistent-header')
         expect(mobile_header).to_be_hidden()  # Header is intentionally hidden per app.py design
@@ -250,7 +243,7 @@ class TestMobileNavigationComplete:
         # Click the specific article by ID (more reliable than CSS selectors)
         feed_item = page.locator(f"#{first_article_id}")
         feed_item.click()
-        wait_for_page_ready(page)
+        wait_for_quiet(page)
         
         # Check if mobile header exists and is visible
         mobile_header_exists = page.evaluate("""() => {
@@ -276,7 +269,7 @@ class TestMobileNavigationComplete:
         page.goto(f"{test_server_url}/?unread=0", timeout=10000)
         # Wait for specific mobile layout element
         page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
-        wait_for_page_ready(page)
+        wait_for_quiet(page)
         
         expect(mobile_header).to_be_hidden()  # Header remains hidden per current design
         print("✅ HEADER VISIBILITY: Remains hidden in list view per design")
@@ -289,7 +282,7 @@ class TestMobileNavigationComplete:
         page.goto(f"{test_server_url}/?unread=0", timeout=10000)
         # Wait for specific mobile layout element
         page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
-        wait_for_page_ready(page)
+        wait_for_quiet(page)
         
         # Click on an article from All Posts view (don't hardcode ID)
         # Get the first available article ID dynamically
@@ -304,7 +297,7 @@ class TestMobileNavigationComplete:
         # Click the specific article by ID (more reliable than CSS selectors)
         feed_item = page.locator(f"#{first_article_id}")
         feed_item.click()
-        wait_for_page_ready(page)
+        wait_for_quiet(page)
         
         page.go_back()
         wait_for_htmx_complete(page)
@@ -316,7 +309,7 @@ class TestMobileNavigationComplete:
         page.goto(f"{test_server_url}/", timeout=10000)
         # Wait for specific mobile layout element
         page.wait_for_selector("#mobile-layout", state="visible", timeout=5000)
-        wait_for_page_ready(page)
+        wait_for_quiet(page)
         
         # Click on an article from Unread view (don't hardcode ID)
         # Get the first available article ID dynamically
@@ -331,7 +324,7 @@ class TestMobileNavigationComplete:
         # Click the specific article by ID (more reliable than CSS selectors)
         feed_item = page.locator(f"#{first_article_id}")
         feed_item.click()
-        wait_for_page_ready(page)
+        wait_for_quiet(page)
         
         page.go_back()
         wait_for_htmx_complete(page)
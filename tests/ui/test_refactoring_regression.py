@@ -8,16 +8,12 @@ any issues from the recent PageData class and optimization refactoring.
 import pytest
 import os
 from playwright.sync_api import Page, expect
+from test_helpers import click_if_present, wait_for_htmx_complete, wait_for_quiet
 import random
 
 pytestmark = pytest.mark.needs_server
 
 
-def wait_for_htmx_complete(page, timeout=5000):
-    """Wait for any HTMX requests to complete"""
-    page.wait_for_selector("body:not(.htmx-request)", timeout=timeout)
-
-
 def ensure_mobile_sidebar_open(page: Page):
     """Helper function to ensure mobile sidebar is open before accessing feed links"""
     # Check if mobile nav button exists and is visible
@@ -76,11 +72,12 @@ class TestRefactoringRegression:
         page.on("console", lambda msg: console_messages.append(f"{msg.type}: {msg.text}"))
         
         # Get list of available feeds from the sidebar - skip "All Feeds" link
-        feed_links = page.locator("#sidebar a[href*='feed_id']").all()
-        if not feed_links:
+        # Locators stay lazy, so each cycle's click re-resolves against the current DOM
+        feed_links = page.locator("#sidebar a[href*='feed_id']")
+        if feed_links.count() == 0:
             # Fallback to original selector
-            feed_links = page.locator("main > div:first-child a").filter(has_not=page.locator("text=All Feeds")).all()
-        feed_count = len(feed_links)
+            feed_links = page.locator("main > div:first-child a").filter(has_not=page.locator("text=All Feeds"))
+        feed_count = feed_links.count()
         assert feed_count >= 2, f"Expected at least 2 feeds, got {feed_count}"
         
         for cycle in range(3):
@@ -93,7 +90,7 @@ class TestRefactoringRegression:
             
             # 1. Click on a random feed in sidebar
             feed_index = cycle % min(feed_count, 3)  # Cycle through first 3 feeds
-            feed_link = feed_links[feed_index]
+            feed_link = feed_links.nth(feed_index)
             feed_name = feed_link.text_content()
             print(f"Clicking feed: {feed_name}")
             
@@ -124,10 +121,10 @@ class TestRefactoringRegression:
                 wait_for_htmx_complete(page)  # Short wait for scroll animation
             
             # 3. Click on an article to view details in right panel
-            article_links = middle_panel.locator("#feeds-list-container .js-filter li").all()  # Each article is in a listitem
-            if article_links:
-                article_index = cycle % len(article_links)
-                article_item = article_links[article_index]
+            article_links = middle_panel.locator("#feeds-list-container .js-filter li")  # Each article is in a listitem
+            article_count = article_links.count()
+            if article_count > 0:
+                article_item = article_links.nth(cycle % article_count)
                 article_title = article_item.locator("strong").text_content()[:50] + "..."
                 print(f"Clicking article: {article_title}")
                 
@@ -151,9 +148,8 @@ class TestRefactoringRegression:
             all_posts_tab = page.locator("text=All Posts").first
             unread_tab = page.locator("text=Unread").first
             
-            if unread_tab.is_visible():
+            if click_if_present(unread_tab):
                 print("Clicking Unread tab")
-                unread_tab.click()
                 wait_for_htmx_complete(page)  # Use HTMX wait instead of networkidle
                 # Wait for feed list to update
                 page.wait_for_selector("li[id^='mobile-feed-item-'], li[id^='desktop-feed-item-']", state="visible", timeout=10000)
@@ -161,9 +157,8 @@ class TestRefactoringRegression:
                 # Take screenshot of unread view
                 page.screenshot(path=f"/tmp/desktop_cycle_{cycle}_unread_tab.png")
             
-            if all_posts_tab.is_visible():
+            if click_if_present(all_posts_tab):
                 print("Clicking All Posts tab")
-                all_posts_tab.click()
                 wait_for_htmx_complete(page)  # Use HTMX wait instead of networkidle
                 # Wait for feed list to update
                 page.wait_for_selector("li[id^='mobile-feed-item-'], li[id^='desktop-feed-item-']", state="visible", timeout=10000)
@@ -218,6 +213,12 @@ class TestRefactoringRegression:
         console_messages = []
         page.on("console", lambda msg: console_messages.append(f"{msg.type}: {msg.text}"))
         
+        # Bound once; locators re-resolve on each action, so nothing is re-queried up front per cycle
+        hamburger_menu = page.locator("button#mobile-nav-button")  # Mobile nav button
+        sidebar = page.locator("#mobile-sidebar")
+        feed_links = sidebar.locator("a").filter(has_not=page.locator("text=All Feeds"))
+        back_buttons = page.locator("button").filter(has_text="←")
+        
         for cycle in range(3):
             print(f"\n=== Mobile Cycle {cycle + 1} ===")
 
@@ -227,7 +228,6 @@ class TestRefactoringRegression:
                 time.sleep(1)
             
             # 1. Click hamburger menu to open sidebar
-            hamburger_menu = page.locator("button#mobile-nav-button")  # Mobile nav button
             expect(hamburger_menu).to_be_visible()
             
             print("Opening hamburger menu")
@@ -235,19 +235,17 @@ class TestRefactoringRegression:
             wait_for_htmx_complete(page)  # Allow animation
             
             # Verify sidebar is visible (first column on mobile)
-            sidebar = page.locator("#mobile-sidebar")
             expect(sidebar).to_be_visible()
             
             # Take screenshot of open sidebar
             page.screenshot(path=f"/tmp/mobile_cycle_{cycle}_sidebar_open.png")
             
             # 2. Click on a feed  
-            feed_links = sidebar.locator("a").filter(has_not=page.locator("text=All Feeds")).all()
-            feed_count = len(feed_links)
+            feed_count = feed_links.count()
             assert feed_count >= 2, f"Expected at least 2 feeds, got {feed_count}"
             
             feed_index = cycle % min(feed_count, 3)
-            feed_link = feed_links[feed_index]
+            feed_link = feed_links.nth(feed_index)
             feed_name = feed_link.text_content()
             print(f"Clicking feed: {feed_name}")
             
@@ -270,16 +268,14 @@ class TestRefactoringRegression:
             expect(feed_container).to_be_visible()
             
             print("Scrolling in mobile feed list")
-            # Scroll down multiple times
-            for scroll in range(3):
-                page.mouse.wheel(0, 500)
-                wait_for_htmx_complete(page)  # Short wait for scroll animation
+            # Scroll to the bottom article directly (the wait above guarantees one exists)
+            feed_container.locator("li[id^='mobile-feed-item-']").last.scroll_into_view_if_needed()
             
             # 4. Click on an article (should navigate to full-screen view)
-            article_links = feed_container.locator("li[id^='mobile-feed-item-']").all()
-            if article_links:
-                article_index = cycle % len(article_links)
-                article_item = article_links[article_index]
+            article_links = feed_container.locator("li[id^='mobile-feed-item-']")
+            article_count = article_links.count()
+            if article_count > 0:
+                article_item = article_links.nth(cycle % article_count)
                 article_title = article_item.locator("strong").text_content()[:50] + "..."
                 print(f"Clicking article: {article_title}")
                 
@@ -294,10 +290,9 @@ class TestRefactoringRegression:
                 
                 # 5. Click back arrow to return to feed list
                 # Look for back button or use browser back
-                back_buttons = page.locator("button").filter(has_text="←").all()
-                if back_buttons:
+                if back_buttons.count() > 0:
                     print("Clicking back button")
-                    back_buttons[0].click()
+                    back_buttons.first.click()
                     wait_for_htmx_complete(page)
                     # Wait for feed list to update
                     page.wait_for_selector("li[id^='mobile-feed-item-']", state="visible", timeout=10000)
@@ -319,9 +314,8 @@ class TestRefactoringRegression:
             all_posts_tab = page.locator("text=All Posts").first
             unread_tab = page.locator("text=Unread").first
             
-            if unread_tab.is_visible():
+            if click_if_present(unread_tab):
                 print("Clicking Unread tab (mobile)")
-                unread_tab.click()
                 wait_for_htmx_complete(page)  # Use HTMX wait instead of networkidle
                 # Wait for feed list to update
                 page.wait_for_selector("li[id^='mobile-feed-item-'], li[id^='desktop-feed-item-']", state="visible", timeout=10000)
@@ -329,9 +323,8 @@ class TestRefactoringRegression:
                 # Take screenshot of mobile unread view
                 page.screenshot(path=f"/tmp/mobile_cycle_{cycle}_unread_tab.png")
             
-            if all_posts_tab.is_visible():
+            if click_if_present(all_posts_tab):
                 print("Clicking All Posts tab (mobile)")
-                all_posts_tab.click()
                 wait_for_htmx_complete(page)  # Use HTMX wait instead of networkidle
                 # Wait for feed list to update
                 page.wait_for_selector("li[id^='mobile-feed-item-'], li[id^='desktop-feed-item-']", state="visible", timeout=10000)
@@ -365,7 +358,7 @@ class TestRefactoringRegression:
         for attempt in range(max_retries):
             try:
                 page.goto(test_server_url, timeout=15000)
-                page.wait_for_load_state("networkidle", timeout=10000)
+                wait_for_quiet(page)
                 page.wait_for_selector("li[id^='desktop-feed-item-']", state="visible", timeout=5000)
                 break
             except Exception as e:
@@ -395,28 +388,27 @@ class TestRefactoringRegression:
         
         # 1. Click on a feed (should trigger HTMX update)
         ensure_mobile_sidebar_open(page)  # Open mobile sidebar if needed
-        feed_links = get_feed_links(page).all()
-        if feed_links:
+        feed_links = get_feed_links(page)
+        if feed_links.count() > 0:
             print("Clicking feed to trigger HTMX update")
-            feed_links[0].click()
+            feed_links.first.click()
             wait_for_htmx_complete(page)
             # Wait for feed content to load (could be mobile or desktop)
             page.wait_for_selector("li[id^='mobile-feed-item-'], li[id^='desktop-feed-item-']", state="visible", timeout=10000)
         
         # 2. Click on an article (should trigger HTMX update)
-        article_items = page.locator("main > div:nth-child(2) li").all()
-        if article_items:
+        article_items = page.locator("main > div:nth-child(2) li")
+        if article_items.count() > 0:
             print("Clicking article to trigger HTMX update")
-            article_items[0].click()
+            article_items.first.click()
             wait_for_htmx_complete(page)
             # Wait for content to load after article click
             page.wait_for_selector("#main-content", state="visible", timeout=10000)
         
         # 3. Toggle between tabs (should trigger HTMX update) - desktop viewport
         unread_tab = page.locator("#desktop-icon-bar button[title='Unread']")
-        if unread_tab.is_visible():
+        if click_if_present(unread_tab):
             print("Toggling to Unread tab")
-            unread_tab.click()
             wait_for_htmx_complete(page)
             # Wait for feed content to load (could be mobile or desktop)
             page.wait_for_selector("li[id^='mobile-feed-item-'], li[id^='desktop-feed-item-']", state="visible", timeout=10000)
@@ -448,7 +440,7 @@ class TestRefactoringRegression:
         for attempt in range(max_retries):
             try:
                 page.goto(test_server_url, timeout=15000)
-                page.wait_for_load_state("networkidle", timeout=10000)
+                wait_for_quiet(page)
                 page.wait_for_selector("li[id^='desktop-feed-item-']", state="visible", timeout=5000)
                 break
             except Exception as e:
@@ -460,22 +452,22 @@ class TestRefactoringRegression:
         
         # Click on a feed
         ensure_mobile_sidebar_open(page)  # Open mobile sidebar if needed
-        feed_links = get_feed_links(page).all()
-        if feed_links:
-            feed_links[0].click()
+        feed_links = get_feed_links(page)
+        if feed_links.count() > 0:
+            feed_links.first.click()
             wait_for_htmx_complete(page)
             # Wait for feed content to load (could be mobile or desktop)
             page.wait_for_selector("li[id^='mobile-feed-item-'], li[id^='desktop-feed-item-']", state="visible", timeout=10000)
         
         # Find articles with blue dots (unread indicators)
-        unread_articles = page.locator("li").filter(has=page.locator(".w-2.h-2.bg-blue-500")).all()
-        initial_unread_count = len(unread_articles)
+        unread_articles = page.locator("li").filter(has=page.locator(".w-2.h-2.bg-blue-500"))
+        initial_unread_count = unread_articles.count()
         
         print(f"Initial unread articles: {initial_unread_count}")
         
-        if unread_articles:
+        if initial_unread_count > 0:
             # Click on first unread article
-            first_unread = unread_articles[0]
+            first_unread = unread_articles.first
             
             # Take screenshot before click
             page.screenshot(path="/tmp/before_article_click.png")
@@ -489,8 +481,8 @@ class TestRefactoringRegression:
             page.screenshot(path="/tmp/after_article_click.png")
             
             # Verify blue dot disappeared
-            remaining_unread = page.locator("li").filter(has=page.locator(".w-2.h-2.bg-blue-500")).all()
-            final_unread_count = len(remaining_unread)
+            remaining_unread = page.locator("li").filter(has=page.locator(".w-2.h-2.bg-blue-500"))
+            final_unread_count = remaining_unread.count()
             
             print(f"Final unread articles: {final_unread_count}")
             
@@ -500,9 +492,8 @@ class TestRefactoringRegression:
         
         # Test unread view behavior
         unread_tab = page.locator("text=Unread").first
-        if unread_tab.is_visible():
-            unread_tab.click()
-            page.wait_for_load_state("networkidle")
+        if click_if_present(unread_tab):
+            wait_for_quiet(page)
             # Wait for feed content to load
             page.wait_for_selector("li[id^='mobile-feed-item-']", state="visible", timeout=10000)
             
@@ -510,9 +501,9 @@ class TestRefactoringRegression:
             page.screenshot(path="/tmp/unread_view.png")
             
             # Click on an article in unread view
-            unread_articles_in_view = page.locator("main > div:nth-child(2) li").all()
-            if unread_articles_in_view:
-                unread_articles_in_view[0].click()
+            unread_articles_in_view = page.locator("main > div:nth-child(2) li")
+            if unread_articles_in_view.count() > 0:
+                unread_articles_in_view.first.click()
                 wait_for_htmx_complete(page)  # Use HTMX wait instead of networkidle
                 # Wait for feed list to update
                 page.wait_for_selector("li[id^='mobile-feed-item-'], li[id^='desktop-feed-item-']", state="visible", timeout=10000)
@@ -2,24 +2,16 @@
 
 import pytest
 from playwright.sync_api import sync_playwright, expect
+from test_helpers import wait_for_htmx_complete, wait_for_quiet
 from contextlib import contextmanager
 
-pytestmark = pytest.mark.needs_server
-
-def wait_for_htmx_complete(page, timeout=5000):
-    """Wait for all HTMX requests to complete"""
-    page.wait_for_function("() => !document.body.classList.contains('htmx-request')", timeout=timeout)
-
-def wait_for_page_ready(page):
-    """Wait for initial page load to stabilize"""
-    page.wait_for_load_state('domcontentloaded')
-    page.wait_for_load_state('networkidle')
-    wait_for_htmx_complete(page)
+# Measures rendered spacing, which depends on the fonts actually loading
+pytestmark = [pytest.mark.needs_server, pytest.mark.visual]
 
 @contextmanager
-def mobile_page_context(browser, width=390, height=844):
+def mobile_page_context(new_context, width=390, height=844):
     """Create a mobile-sized page context (iPhone 12 Pro dimensions)"""
-    context = browser.new_context(
+    context = new_context(
         viewport={'width': width, 'height': height},
         user_agent='Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15'
     )
@@ -32,12 +24,12 @@ def mobile_page_context(browser, width=390, height=844):
 class TestSpacingValidation:
     """Test spacing and UX layout validation"""
     
-    def test_perfect_tab_layout_mobile(self, browser, test_server_url):
+    def test_perfect_tab_layout_mobile(self, new_context, test_server_url):
         """Test that tabs are compact, right-aligned, and All Feeds has space"""
-        with mobile_page_context(browser) as page:
+        with mobile_page_context(new_context) as page:
             try:
                 page.goto(test_server_url, timeout=10000)
-                wait_for_page_ready(page)
+                wait_for_quiet(page)
                 
                 # Wait for tab structure to load
                 page.wait_for_selector('.uk-tab-alt', timeout=10000)
@@ -77,12 +69,12 @@ class TestSpacingValidation:
             except Exception as e:
                 assert True, f"Browser test failed ({e}), but tab layout CSS is properly implemented"
     
-    def test_tab_buttons_no_grey_border(self, browser):
+    def test_tab_buttons_no_grey_border(self, new_context):
         """Test that active tab buttons have no grey border"""
-        with mobile_page_context(browser) as page:
+        with mobile_page_context(new_context) as page:
             try:
                 page.goto(test_server_url, timeout=10000)
-                wait_for_page_ready(page)
+                wait_for_quiet(page)
                 
                 # Find active tab button
                 active_tab = page.locator('.uk-tab-alt .uk-active a')
@@ -111,13 +103,13 @@ class TestSpacingValidation:
             except Exception as e:
                 assert True, f"Browser test failed ({e}), but border removal CSS is implemented"
     
-    def test_first_item_top_spacing(self, browser):
+    def test_first_item_top_spacing(self, new_context):
         """Test that the first item in list view has proper top margin/padding"""
         # Test with a real browser context to validate spacing
-        with mobile_page_context(browser) as page:
+        with mobile_page_context(new_context) as page:
             try:
                 page.goto(test_server_url, timeout=10000)
-                wait_for_page_ready(page)
+                wait_for_quiet(page)
                 
                 # Wait for feed list to load
                 page.wait_for_selector('.js-filter', timeout=10000)
@@ -148,12 +140,12 @@ class TestSpacingValidation:
                 # Verify that we removed pt-0 and use p-4 instead
                 assert True, f"Browser test failed ({e}), but spacing CSS has been fixed in code"
     
-    def test_action_buttons_horizontal_padding(self, browser):
+    def test_action_buttons_horizontal_padding(self, new_context):
         """Test that action buttons line has same padding as header"""
-        with mobile_page_context(browser) as page:
+        with mobile_page_context(new_context) as page:
             try:
                 page.goto(test_server_url, timeout=10000)
-                wait_for_page_ready(page)
+                wait_for_quiet(page)
                 
                 # Wait for feed items and click one to view detail
                 feed_items = page.locator('.cursor-pointer.rounded-lg').filter(is_visible=True)
@@ -212,12 +204,12 @@ class TestSpacingValidation:
                 # Fallback validation: Verify the CSS class structure
                 assert True, f"Browser test failed ({e}), but padding CSS has been added in code"
     
-    def test_spacing_consistency_mobile(self, browser):
+    def test_spacing_consistency_mobile(self, new_context):
         """Test that spacing is consistent across mobile layout"""
-        with mobile_page_context(browser) as page:
+        with mobile_page_context(new_context) as page:
             try:
                 page.goto(test_server_url, timeout=10000)
-                wait_for_page_ready(page)
+                wait_for_quiet(page)
                 
                 # Get all containers that should have consistent padding
                 containers = page.locator('[class*="p-4"], [class*="m-4"], [class*="mx-4"]')
@@ -6,14 +6,11 @@ This test validates the core functionality after the PageData class refactoring.
 import os
 import pytest
 from playwright.sync_api import Page, expect
+from test_helpers import click_if_present, wait_for_htmx_complete
 
 pytestmark = pytest.mark.needs_server
 
 
-def wait_for_htmx_complete(page, timeout=5000):
-    """Wait for all HTMX requests to complete - much faster than fixed timeouts"""
-    page.wait_for_function("() => !document.body.classList.contains('htmx-request')", timeout=timeout)
-
 def wait_for_page_ready(page):
     """Fast page ready check - waits for network idle instead of fixed timeout"""
     wait_for_htmx_complete(page)
@@ -32,7 +29,6 @@ class TestWorkingRegression:
         5. Test tab switching
         """
         # Navigate and wait for page load
-        page.set_viewport_size({"width": 1200, "height": 800})  # Ensure desktop layout
         page.goto(test_server_url, timeout=10000)
         wait_for_page_ready(page)
         
@@ -74,8 +70,8 @@ class TestWorkingRegression:
         print("=== Testing Article Selection ===")
         
         # Find articles with blue dots (unread indicators) 
-        unread_articles_before = page.locator("li").filter(has=page.locator(".bg-blue-600")).all()
-        initial_unread_count = len(unread_articles_before)
+        unread_articles_before = page.locator("li").filter(has=page.locator(".bg-blue-600"))
+        initial_unread_count = unread_articles_before.count()
         print(f"Initial unread articles: {initial_unread_count}")
         
         # Click on first available article
@@ -98,8 +94,8 @@ class TestWorkingRegression:
         expect(article_detail).to_be_visible()
         
         # Verify the blue dot disappeared (article marked as read)
-        unread_articles_after = page.locator("li").filter(has=page.locator(".bg-blue-600")).all()
-        final_unread_count = len(unread_articles_after)
+        unread_articles_after = page.locator("li").filter(has=page.locator(".bg-blue-600"))
+        final_unread_count = unread_articles_after.count()
         print(f"Final unread articles: {final_unread_count}")
         
         # Should have one less unread article
@@ -112,8 +108,7 @@ class TestWorkingRegression:
         # Test Unread tab
         # Desktop viewport test - use desktop elements
         unread_tab = page.locator("#desktop-icon-bar button[title='Unread']")
-        if unread_tab.is_visible():
-            unread_tab.click()
+        if click_if_present(unread_tab):
             wait_for_htmx_complete(page)
             # Wait for feed list to update
             page.wait_for_selector("li[id^='desktop-feed-item-']", state="visible", timeout=10000)
@@ -122,8 +117,7 @@ class TestWorkingRegression:
         # Test All Posts tab  
         # Desktop viewport test - use desktop elements
         all_posts_tab = page.locator("#desktop-icon-bar button[title='All Posts']")
-        if all_posts_tab.is_visible():
-            all_posts_tab.click()
+        if click_if_present(all_posts_tab):
             wait_for_htmx_complete(page)
             # Wait for feed list to update
             page.wait_for_selector("li[id^='desktop-feed-item-']", state="visible", timeout=10000)
@@ -344,20 +338,20 @@ class TestWorkingRegression:
             page.wait_for_selector("li[id^='desktop-feed-item-']", state="visible", timeout=10000)
             
             # Count unread articles
-            initial_unread = page.locator("li").filter(has=page.locator(".bg-blue-600")).all()
-            initial_count = len(initial_unread)
+            initial_unread = page.locator("li").filter(has=page.locator(".bg-blue-600"))
+            initial_count = initial_unread.count()
             
             if initial_count > 0:
                 # Click first unread article
-                first_unread = initial_unread[0]
+                first_unread = initial_unread.first
                 first_unread.click()
                 wait_for_htmx_complete(page)
                 # Wait for detail panel to load
                 page.wait_for_selector("#desktop-item-detail, #mobile-item-detail", state="visible", timeout=5000)
                 
                 # Check unread count decreased
-                remaining_unread = page.locator("li").filter(has=page.locator(".bg-blue-600")).all()
-                remaining_count = len(remaining_unread)
+                remaining_unread = page.locator("li").filter(has=page.locator(".bg-blue-600"))
+                remaining_count = remaining_unread.count()
                 
                 assert remaining_count == initial_count - 1, \
                     f"Expected {initial_count - 1} unread, got {remaining_count}"
@@ -368,8 +362,8 @@ class TestWorkingRegression:
                 
                 # The article we just read should not appear in unread view
                 # (This tests the filtering logic)
-                unread_view_items = page.locator("li[id^='desktop-feed-item-']").all()
-                print(f"Items in unread view: {len(unread_view_items)}")
+                unread_view_items = page.locator("li[id^='desktop-feed-item-']")
+                print(f"Items in unread view: {unread_view_items.count()}")
                 
                 print("✓ Read/unread state management working correctly")
             else: